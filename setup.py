@@ -1,8 +1,25 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            Extension(
+                "src.infrastructure.document_processing.orchestrators.cost_calculator_ext",
+                ["src/infrastructure/document_processing/orchestrators/cost_calculator_ext.pyx"],
+                extra_compile_args=["-O3"],
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+except ImportError:
+    # CostCalculator falls back to Numba/NumPy when the extension is absent
+    ext_modules = []
 
 setup(
     name="prismy-agent",
     version="1.0.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     python_requires=">=3.9",
 )
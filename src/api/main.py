@@ -4,6 +4,7 @@ load_dotenv()
 """
 Main FastAPI application
 """
+import sys
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from src.config.logging_config import setup_logging, get_logger
@@ -61,3 +62,11 @@ async def startup_event():
 async def shutdown_event():
     """Shutdown tasks"""
     logger.info("API shutting down...")
+    # Close pooled provider connections, only for providers that were used
+    for module_name in (
+        "src.infrastructure.llm.providers.openai_provider",
+        "src.infrastructure.llm.providers.anthropic_provider",
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            await module.close_shared_clients()
@@ -14,6 +14,21 @@ router = APIRouter()
 # Initialize service
 translation_service = TranslationService()
 
+# Static, so the /languages response is built once
+SUPPORTED_LANGUAGES = (
+    ("en", "English"),
+    ("vi", "Vietnamese"),
+    ("zh", "Chinese"),
+    ("ja", "Japanese"),
+    ("ko", "Korean"),
+    ("es", "Spanish"),
+    ("fr", "French"),
+    ("de", "German"),
+)
+_LANGUAGES_RESPONSE = {
+    "languages": [{"code": code, "name": name} for code, name in SUPPORTED_LANGUAGES]
+}
+
 class TranslateRequest(BaseModel):
     """Translation request model"""
     text: str = Field(..., min_length=1, max_length=50000)
@@ -69,15 +84,4 @@ async def translate(request: TranslateRequest):
 @router.get("/languages")
 async def get_supported_languages():
     """Get supported languages"""
-    return {
-        "languages": [
-            {"code": "en", "name": "English"},
-            {"code": "vi", "name": "Vietnamese"},
-            {"code": "zh", "name": "Chinese"},
-            {"code": "ja", "name": "Japanese"},
-            {"code": "ko", "name": "Korean"},
-            {"code": "es", "name": "Spanish"},
-            {"code": "fr", "name": "French"},
-            {"code": "de", "name": "German"}
-        ]
-    }
+    return _LANGUAGES_RESPONSE
@@ -1,14 +1,21 @@
 """
 Translation service with multiple providers
 """
+import asyncio
+import hashlib
 import os
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from src.config.logging_config import get_logger
 from src.core.exceptions import TranslationError
 
 logger = get_logger(__name__)
 
+# Maximum translations kept in the in-process LRU cache, and how long they stay valid
+CACHE_MAX_ENTRIES = 10_000
+CACHE_TTL_SECONDS = 24 * 3600
+
 class TranslationResult:
     def __init__(self, translated_text: str, source_lang: str, target_lang: str, 
                  confidence: float = 0.95, processing_time: float = 0.0):
@@ -24,6 +31,15 @@ class TranslationService:
         self.provider = os.getenv("LLM_PROVIDER", "google")
         self.openai_key = os.getenv("OPENAI_API_KEY", "")
         self.anthropic_key = os.getenv("ANTHROPIC_API_KEY", "")
+        # (translated_text, confidence, expires_at) by request digest, least recently used first
+        self._cache: "OrderedDict[bytes, Tuple[str, float, float]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._inflight: Dict[bytes, asyncio.Future] = {}  # Requests currently being translated
+        # Settled once: an LLM provider is used only when it has an API key
+        self._use_llm = self.provider in ("openai", "anthropic") and self.is_configured()
+        self._llm = None  # Created on first use
+        self._backend = self.provider if self._use_llm else "google"
         
         logger.info(f"TranslationService initialized with provider: {self.provider}")
         
@@ -42,35 +58,71 @@ class TranslationService:
         """Translate text using configured provider"""
         start_time = time.time()
         
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._cache_key(text, source_lang, target_lang)
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[2] < time.monotonic():
+                del self._cache[cache_key]
+                cached = None
+            if cached is not None:
+                self._cache_hits += 1
+                self._cache.move_to_end(cache_key)
+                return TranslationResult(
+                    translated_text=cached[0],
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    confidence=cached[1],
+                    processing_time=time.time() - start_time
+                )
+            
+            self._cache_misses += 1
+            
+            # Share the answer of an identical request that is already in flight
+            pending = self._inflight.get(cache_key)
+            if pending is not None:
+                outcome = await asyncio.shield(pending)
+                if outcome is None:
+                    # The leading request was cancelled; this one was not, so retry
+                    return await self.translate_text(text, source_lang, target_lang, style)
+                translated_text, confidence = outcome
+                return TranslationResult(
+                    translated_text=translated_text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    confidence=confidence,
+                    processing_time=time.time() - start_time
+                )
+            pending = self._inflight[cache_key] = asyncio.get_running_loop().create_future()
+        
         try:
             logger.info(f"Translating with {self.provider}: {text[:50]}...")
             
             translated_text = ""
             
             # Use configured provider
-            if self.provider == "openai" and self.openai_key:
-                from src.infrastructure.llm.providers.openai_provider import OpenAIProvider
-                provider = OpenAIProvider()
-                translated_text = await provider.translate(text, source_lang, target_lang)
-                confidence = 0.95
-                
-            elif self.provider == "anthropic" and self.anthropic_key:
-                from src.infrastructure.llm.providers.anthropic_provider import AnthropicProvider
-                provider = AnthropicProvider()
-                translated_text = await provider.translate(text, source_lang, target_lang)
+            if self._use_llm:
+                translated_text = await self._get_llm().translate(text, source_lang, target_lang)
                 confidence = 0.95
                 
             else:
                 # Default to Google Translate
                 from deep_translator import GoogleTranslator
                 translator = GoogleTranslator(source=source_lang, target=target_lang)
-                translated_text = translator.translate(text)
+                # deep_translator blocks on HTTP; run it off the event loop so calls overlap
+                translated_text = await asyncio.to_thread(translator.translate, text)
                 confidence = 0.9
             
             processing_time = time.time() - start_time
             
             logger.info(f"Translation successful: {translated_text[:50]}...")
             
+            if cache_key is not None:
+                self._cache[cache_key] = (translated_text, confidence, time.monotonic() + CACHE_TTL_SECONDS)
+                if len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+                pending.set_result((translated_text, confidence))
+            
             return TranslationResult(
                 translated_text=translated_text,
                 source_lang=source_lang,
@@ -81,4 +133,57 @@ class TranslationService:
             
         except Exception as e:
             logger.error(f"Translation failed: {e}")
-            raise TranslationError(f"Translation failed: {str(e)}")
+            error = TranslationError(f"Translation failed: {str(e)}")
+            if cache_key is not None:
+                pending.set_exception(error)
+                pending.exception()  # Retrieved, even if no duplicate was waiting
+            raise error
+        
+        finally:
+            if cache_key is not None:
+                del self._inflight[cache_key]
+                if not pending.done():
+                    # Cancelled leader: release waiters without cancelling them too
+                    pending.set_result(None)
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                              concurrency: int = 8) -> List[TranslationResult]:
+        """Translate many texts with up to `concurrency` requests in flight, preserving order"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def translate_one(text: str) -> TranslationResult:
+            async with semaphore:
+                return await self.translate_text(text, source_lang, target_lang)
+        
+        # Duplicate texts resolve through the cache or the in-flight map
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Translation cache size and hit rate"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "entries": len(self._cache),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0
+        }
+    
+    def _get_llm(self):
+        """LLM provider for this service, created once"""
+        if self._llm is None:
+            if self.provider == "openai":
+                from src.infrastructure.llm.providers.openai_provider import OpenAIProvider
+                self._llm = OpenAIProvider()
+            else:
+                from src.infrastructure.llm.providers.anthropic_provider import AnthropicProvider
+                self._llm = AnthropicProvider()
+        return self._llm
+    
+    def _cache_key(self, text: str, source_lang: str, target_lang: str) -> bytes:
+        """Digest identifying a translation request"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (self._backend, source_lang, target_lang):
+            hasher.update(part.encode())
+            hasher.update(b'|')
+        hasher.update(text.encode())
+        return hasher.digest()
@@ -0,0 +1,67 @@
+"""
+Circuit breaker for calls to external services
+"""
+import time
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Calls go through
+    OPEN = "open"            # Calls are rejected without trying
+    HALF_OPEN = "half_open"  # One probe call decides whether to close again
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing service until it has had time to recover.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    callers fail fast instead of waiting on timeouts. Once
+    `recovery_timeout` seconds have passed, a single probe call is let
+    through; its outcome closes or re-opens the circuit.
+
+    Args:
+        failure_threshold: Consecutive failures before opening
+        recovery_timeout: Seconds to stay open before probing
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        # Half open: only one probe at a time
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self):
+        """Free the probe slot without recording an outcome (e.g. the call was cancelled)."""
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
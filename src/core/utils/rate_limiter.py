@@ -0,0 +1,63 @@
+"""
+Client-side rate limiting with a token bucket
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for async callers.
+
+    Callers only wait when taking tokens would exceed the configured rate,
+    so bursts up to the bucket capacity go through immediately.
+
+    Args:
+        rate: Tokens added per `per` seconds
+        per: Refill period in seconds
+        capacity: Maximum burst size (defaults to rate)
+    """
+
+    def __init__(self, rate: float, per: float = 60.0, capacity: Optional[float] = None):
+        self.refill_rate = rate / per  # Tokens per second
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._slow_factor = 1.0
+        self._slow_until = 0.0
+
+    def _current_rate(self, now: float) -> float:
+        if now < self._slow_until:
+            return self.refill_rate * self._slow_factor
+        return self.refill_rate
+
+    def _refill(self):
+        now = time.monotonic()
+        rate = self._current_rate(now)
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def slow_down(self, factor: float = 0.5, duration: float = 30.0):
+        """Refill at `factor` times the normal rate for `duration` seconds (e.g. after a 429)."""
+        self._refill()
+        self._slow_factor = factor
+        self._slow_until = time.monotonic() + duration
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        while True:
+            # No await between check and take, so concurrent tasks cannot overdraw
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return
+            await asyncio.sleep((amount - self._tokens) / self._current_rate(time.monotonic()))
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -1,5 +1,6 @@
 """OpenAI-based translation service implementation."""
 
+import functools
 import openai
 import time
 import hashlib
@@ -15,6 +16,19 @@ from src.core.entities.translation import (
 )
 
 
+LANG_NAMES = {
+    'vi': 'Vietnamese', 'en': 'English', 'zh': 'Chinese',
+    'ja': 'Japanese', 'fr': 'French', 'de': 'German',
+    'es': 'Spanish', 'ko': 'Korean'
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _system_prompt(target_language: str) -> str:
+    """System prompt for a target language name, built once per language."""
+    return f"You are a professional translator. Translate the following text to {target_language}. Preserve formatting, meaning, and style exactly."
+
+
 class OpenAITranslator(TranslatorInterface):
     """OpenAI-based translator implementation."""
     
@@ -28,14 +42,7 @@ class OpenAITranslator(TranslatorInterface):
         start_time = time.time()
         
         try:
-            # Language mapping
-            lang_names = {
-                'vi': 'Vietnamese', 'en': 'English', 'zh': 'Chinese',
-                'ja': 'Japanese', 'fr': 'French', 'de': 'German',
-                'es': 'Spanish', 'ko': 'Korean'
-            }
-            
-            target_language = lang_names.get(request.target_language, request.target_language)
+            target_language = LANG_NAMES.get(request.target_language, request.target_language)
             
             # Make API call
             response = self.client.chat.completions.create(
@@ -43,7 +50,7 @@ class OpenAITranslator(TranslatorInterface):
                 messages=[
                     {
                         "role": "system", 
-                        "content": f"You are a professional translator. Translate the following text to {target_language}. Preserve formatting, meaning, and style exactly."
+                        "content": _system_prompt(target_language)
                     },
                     {
                         "role": "user", 
@@ -11,10 +11,25 @@ from .base_transformer import (
     TransformationRequest,
     TransformationResponse
 )
-from .podcast_generator import PodcastGenerator
-from .unified_video_processor import UnifiedVideoProcessor
-from .education_module_builder import EducationModuleBuilder
-from .transformation_manager import TransformationManager
+import importlib
+
+# Generators pull in the LLM and AI intelligence stacks, so they are imported on
+# first access (PEP 562) rather than whenever base_transformer is needed
+_LAZY_IMPORTS = {
+    'PodcastGenerator': '.podcast_generator',
+    'UnifiedVideoProcessor': '.unified_video_processor',
+    'EducationModuleBuilder': '.education_module_builder',
+    'TransformationManager': '.transformation_manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'BaseContentTransformer',
@@ -0,0 +1,74 @@
+# src/infrastructure/document_processing/cache/result_store.py
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from src.core.utils.logger import Logger
+
+logger = Logger(__name__)
+
+
+class ResultStore:
+    """
+    Persistent store of processed chunk content, backed by SQLite.
+
+    Survives restarts, so re-running a document does not pay for
+    requests that were already answered. Entries expire after a TTL.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 7 * 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Autocommit connection shared across threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode this syncs at checkpoints rather than on every insert;
+        # a crash can only lose recent entries, which are re-requested
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Drop what expired while the store was closed, so it does not grow forever
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get stored content, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str):
+        """Store content under key, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl_seconds)
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM results WHERE expires_at < ?", (time.time(),)
+            )
+        logger.info(f"Purged {cursor.rowcount} expired results")
+        return cursor.rowcount
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,6 +1,8 @@
 # src/infrastructure/document_processing/optimizers/hybrid_processor.py
 
 import asyncio
+import functools
+import heapq
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import spacy
@@ -23,6 +25,27 @@ except:
 
 logger = Logger(__name__)
 
+# Sentence boundary used for cheap chunk summaries
+_RE_SENT = re.compile(r'(?<=[.!?])\s+')
+
+
+@functools.lru_cache(maxsize=4)
+def _get_tokenizer(name: str):
+    """Load a fast tokenizer once and share it across processors."""
+    return AutoTokenizer.from_pretrained(name, use_fast=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_spacy_model(name: str):
+    """Load a spaCy pipeline once and share it across processors."""
+    try:
+        return spacy.load(name)
+    except OSError:
+        logger.warning("Spacy model not found. Installing...")
+        import subprocess
+        subprocess.run(["python", "-m", "spacy", "download", name])
+        return spacy.load(name)
+
 
 @dataclass
 class ProcessedContent:
@@ -55,14 +78,8 @@ class HybridProcessor:
     """
     
     def __init__(self):
-        # Load NLP models
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            logger.warning("Spacy model not found. Installing...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
+        # Load NLP models (shared across instances)
+        self.nlp = _get_spacy_model("en_core_web_sm")
             
         # Initialize summarizer (local model)
         try:
@@ -75,7 +92,7 @@ class HybridProcessor:
             logger.warning("BART model not available, using fallback")
             self.summarizer = None
             
-        self.tokenizer = AutoTokenizer.from_pretrained("bert-base-uncased")
+        self.tokenizer = _get_tokenizer("bert-base-uncased")
         
     async def preprocess_document(
         self,
@@ -208,6 +225,11 @@ class HybridProcessor:
                     "end": ent.end_char
                 })
                 seen.add(ent.text.lower())
+                if len(entities) >= 50:
+                    break
+                
+        if len(entities) >= 50:
+            return entities  # Limit to top 50
                 
         # Also extract noun phrases
         for chunk in doc.noun_chunks:
@@ -219,8 +241,10 @@ class HybridProcessor:
                     "end": chunk.end_char
                 })
                 seen.add(chunk.text.lower())
+                if len(entities) >= 50:
+                    break
                 
-        return entities[:50]  # Limit to top 50
+        return entities  # Limit to top 50
     
     def _extract_relationships(
         self,
@@ -443,8 +467,8 @@ class HybridProcessor:
     async def _create_chunk_summary(self, content: str) -> str:
         """Create summary for a chunk."""
         # For chunks, use simpler extraction
-        sentences = content.split('.')[:3]  # First 3 sentences
-        return '. '.join(sentences).strip()
+        sentences = _RE_SENT.split(content, maxsplit=3)[:3]  # First 3 sentences
+        return ' '.join(sentences).strip()
     
     def _extract_key_sentences(self, content: str, count: int = 3) -> List[str]:
         """Extract key sentences from content."""
@@ -490,9 +514,8 @@ class HybridProcessor:
         if len(knowledge_graph) == 0:
             return self.compress_for_llm(content, max_tokens)
             
-        # Calculate centrality
-        centrality = nx.degree_centrality(knowledge_graph)
-        top_entities = sorted(centrality.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Rank by degree (normalization is not needed for ordering)
+        top_entities = heapq.nlargest(10, knowledge_graph.degree(), key=lambda nd: nd[1])
         
         # Create compressed representation
         compressed_parts = []
@@ -1,28 +1,123 @@
 # src/infrastructure/document_processing/orchestrators/cost_calculator.py
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import functools
+import os
+import sys
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
+# Prefer the compiled Cython kernels; fall back to Numba, then plain NumPy
+try:
+    from src.infrastructure.document_processing.orchestrators import cost_calculator_ext
+    CYTHON_AVAILABLE = True
+except ImportError:
+    cost_calculator_ext = None
+    CYTHON_AVAILABLE = False
+
+NUMBA_AVAILABLE = False
+if not CYTHON_AVAILABLE:
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
 from src.core.models.document import Document, DocumentChunk
 from src.core.utils.logger import Logger
 
 logger = Logger(__name__)
 
+# Usage aggregates are kept in hourly buckets for one week
+USAGE_BUCKET_SECONDS = 3600
+USAGE_BUCKET_RETENTION = 168
+
+# Initial row capacity of the columnar usage store (grows geometrically)
+USAGE_INITIAL_CAPACITY = 1024
+
+# Maximum usage records retained; the oldest are dropped beyond this
+COST_HISTORY_MAX = int(os.getenv("COST_HISTORY_MAX", "100000"))
+
+# Output tokens relative to input tokens, by output format
+_OUTPUT_MULTIPLIERS = MappingProxyType({
+    "translation": 1.0,
+    "summary": 0.2,
+    "podcast": 1.5,
+    "course": 2.0,
+    "video": 0.8,
+    "screenplay": 1.2
+})
+
+# Portion of document processing each task represents
+_TASK_PORTIONS = MappingProxyType({
+    "outline": 0.05,
+    "summary": 0.10,
+    "main_processing": 0.70,
+    "refinement": 0.10,
+    "formatting": 0.05
+})
+
+# Default output/input token ratio by chunk type
+_CHUNK_OUTPUT_RATIO_BY_TYPE = MappingProxyType({
+    "summary": 0.2,
+    "scene": 1.5,
+    "dialogue": 1.2,
+    "general": 1.0
+})
+
+# Tokens per word (1.33) in Q10 fixed point: (words * 1362) >> 10 ~= words * 1.330078
+_TOKENS_PER_WORD_Q10 = 1362
+
+# Chunk types indexed into the output ratio table for batch pricing
+_CHUNK_TYPE_IDS = MappingProxyType(
+    {chunk_type: i for i, chunk_type in enumerate(_CHUNK_OUTPUT_RATIO_BY_TYPE)}
+)
+_CHUNK_OUTPUT_RATIOS = np.array(list(_CHUNK_OUTPUT_RATIO_BY_TYPE.values()), dtype=np.float64)
+
+
+def _chunk_cost_kernel(word_counts, type_ids, in_per_tok, out_per_tok, ratios):
+    """Price a batch of chunks from their word counts and type ids."""
+    input_tokens = (word_counts * _TOKENS_PER_WORD_Q10) >> 10
+    output_tokens = np.floor(input_tokens * ratios[type_ids])
+    return input_tokens * in_per_tok + output_tokens * out_per_tok
+
+
+if CYTHON_AVAILABLE:
+    _chunk_cost_kernel = cost_calculator_ext.chunk_cost_kernel
+elif NUMBA_AVAILABLE:
+    _chunk_cost_kernel = njit(cache=True, fastmath=True)(_chunk_cost_kernel)
+    # Compile at import so the first real batch does not pay for it
+    _chunk_cost_kernel(
+        np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), 0.0, 0.0, _CHUNK_OUTPUT_RATIOS
+    )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelPricing:
     """Pricing information for AI models."""
     provider: str
     model: str
     input_cost_per_1k: float  # USD per 1K input tokens
     output_cost_per_1k: float  # USD per 1K output tokens
+    input_cost_per_token: float = field(init=False, repr=False, compare=False)
+    output_cost_per_token: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute per-token prices so cost math skips the /1000."""
+        object.__setattr__(self, "input_cost_per_token", self.input_cost_per_1k * 1e-3)
+        object.__setattr__(self, "output_cost_per_token", self.output_cost_per_1k * 1e-3)
     
     def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate total cost for given token usage."""
-        input_cost = (input_tokens / 1000) * self.input_cost_per_1k
-        output_cost = (output_tokens / 1000) * self.output_cost_per_1k
-        return input_cost + output_cost
+        return (
+            input_tokens * self.input_cost_per_token
+            + output_tokens * self.output_cost_per_token
+        )
 
 
 class CostCalculator:
@@ -30,11 +125,98 @@ class CostCalculator:
     
     def __init__(self):
         self.pricing = self._initialize_pricing()
-        self.usage_history = []
+        self._init_usage_store()
+        self._hourly_buckets = deque(maxlen=USAGE_BUCKET_RETENTION)
+        self._build_pricing_arrays()
+        # Chunk cost functions specialized per (model, chunk type)
+        self._chunk_cost_fns: Dict[Tuple[str, str], Callable[[int], float]] = {}
+        # Per-instance memo of estimates keyed by (tokens, format, strategy)
+        self._estimate_cost_cached = functools.lru_cache(maxsize=256)(
+            self._estimate_cost
+        )
+        
+    def _init_usage_store(self):
+        """Create the columnar (struct-of-arrays) usage record store."""
+        if COST_HISTORY_MAX < 1:
+            raise ValueError(f"COST_HISTORY_MAX must be at least 1, got {COST_HISTORY_MAX}")
+        self._usage_max = COST_HISTORY_MAX
+        capacity = min(USAGE_INITIAL_CAPACITY, self._usage_max)
+        self._usage_n = 0
+        # Once full the store is a ring buffer; this is the slot of the oldest row
+        self._usage_head = 0
+        self._usage = {
+            "ts": np.empty(capacity, dtype=np.float64),
+            "in": np.empty(capacity, dtype=np.int64),
+            "out": np.empty(capacity, dtype=np.int64),
+            "cost": np.empty(capacity, dtype=np.float64),
+            "model_id": np.empty(capacity, dtype=np.int32),
+            "doc_id": np.empty(capacity, dtype=np.int32),
+            # Chunk ids are mostly unique, so they are stored as-is rather than interned
+            "chunk_id": np.empty(capacity, dtype=object)
+        }
+        # Repeated string columns are interned to integer codes
+        self._usage_models: List[str] = []
+        self._usage_model_ids: Dict[str, int] = {}
+        self._usage_docs: List[str] = []
+        self._usage_doc_ids: Dict[str, int] = {}
+    
+    @staticmethod
+    def _intern_code(value: str, values: List[str], ids: Dict[str, int]) -> int:
+        """Return the integer code for value, assigning a new one if needed."""
+        code = ids.get(value)
+        if code is None:
+            code = ids[value] = len(values)
+            values.append(value)
+        return code
+    
+    def _compact_codes(self, column: str, values: List[str], ids: Dict[str, int]):
+        """Re-intern a column so its table only holds values still referenced."""
+        codes = self._usage[column][:self._usage_n]
+        used, codes[:] = np.unique(codes, return_inverse=True)
+        values[:] = [values[code] for code in used.tolist()]
+        ids.clear()
+        ids.update((value, code) for code, value in enumerate(values))
+    
+    def _ordered_usage(self) -> Dict[str, np.ndarray]:
+        """Usage columns with rows in insertion (oldest first) order."""
+        n = self._usage_n
+        head = self._usage_head
+        if not head:
+            return {column: values[:n] for column, values in self._usage.items()}
+        return {
+            column: np.concatenate((values[head:n], values[:head]))
+            for column, values in self._usage.items()
+        }
+    
+    @property
+    def usage_history(self) -> List[Dict[str, any]]:
+        """Usage records materialized from the columnar store."""
+        usage = self._ordered_usage()
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(ts),
+                "model": self._usage_models[model_id],
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "cost": cost,
+                "document_id": self._usage_docs[doc_id],
+                "chunk_id": chunk_id
+            }
+            for ts, model_id, input_tokens, output_tokens, cost, doc_id, chunk_id in zip(
+                usage["ts"].tolist(),
+                usage["model_id"].tolist(),
+                usage["in"].tolist(),
+                usage["out"].tolist(),
+                usage["cost"].tolist(),
+                usage["doc_id"].tolist(),
+                usage["chunk_id"].tolist()
+            )
+        ]
         
     def _initialize_pricing(self) -> Dict[str, ModelPricing]:
         """Initialize current model pricing (as of June 2025)."""
-        return {
+        pricing = {
             # OpenAI Models
             "gpt-3.5-turbo": ModelPricing(
                 provider="openai",
@@ -89,6 +271,31 @@ class CostCalculator:
                 output_cost_per_1k=0.00375
             )
         }
+        # Interned keys let lookups with interned names short-circuit on identity
+        return {sys.intern(name): model_pricing for name, model_pricing in pricing.items()}
+    
+    def _build_pricing_arrays(self):
+        """Build parallel pricing arrays for vectorized cost estimation."""
+        model_names = list(self.pricing)
+        self._model_idx = {name: i for i, name in enumerate(model_names)}
+        self._provider_names = list(dict.fromkeys(p.provider for p in self.pricing.values()))
+        provider_idx = {provider: i for i, provider in enumerate(self._provider_names)}
+        
+        self._in_per_tok = np.array(
+            [self.pricing[name].input_cost_per_token for name in model_names], dtype=np.float64
+        )
+        self._out_per_tok = np.array(
+            [self.pricing[name].output_cost_per_token for name in model_names], dtype=np.float64
+        )
+        self._providers = np.array(
+            [provider_idx[self.pricing[name].provider] for name in model_names], dtype=np.intp
+        )
+        
+        # Models ordered by combined input+output price for budget selection
+        self._by_cost = sorted(
+            (p.input_cost_per_1k + p.output_cost_per_1k, name)
+            for name, p in self.pricing.items()
+        )
     
     def estimate_document_cost(
         self,
@@ -105,71 +312,122 @@ class CostCalculator:
             model_strategy: Mapping of task types to models
             
         Returns:
-            Cost breakdown by model and total
+            Cost breakdown with per-task model/cost ("by_task"), "total"
+            and "by_provider"
         """
-        # Estimate tokens
-        total_input_tokens = document.estimate_tokens()
-        
-        # Output multipliers based on format
-        output_multipliers = {
-            "translation": 1.0,
-            "summary": 0.2,
-            "podcast": 1.5,
-            "course": 2.0,
-            "video": 0.8,
-            "screenplay": 1.2
-        }
+        cost_breakdown = self._estimate_cost_cached(
+            document.estimate_tokens(),
+            output_format,
+            tuple(model_strategy.items())
+        )
         
-        output_multiplier = output_multipliers.get(output_format, 1.0)
+        # Copy so callers cannot mutate the cached result
+        result = dict(cost_breakdown)
+        result["by_task"] = {
+            task_type: dict(task_cost)
+            for task_type, task_cost in cost_breakdown["by_task"].items()
+        }
+        result["by_provider"] = dict(cost_breakdown["by_provider"])
+        return result
+    
+    def _estimate_cost(
+        self,
+        total_input_tokens: int,
+        output_format: str,
+        strategy_items: tuple
+    ) -> Dict[str, float]:
+        """Compute the cost breakdown for a token count and model strategy."""
+        output_multiplier = _OUTPUT_MULTIPLIERS.get(output_format, 1.0)
         estimated_output_tokens = int(total_input_tokens * output_multiplier)
         
-        # Calculate costs per model
-        cost_breakdown = {}
-        total_cost = 0.0
+        if len(strategy_items) == 1:
+            task_type, model_name = strategy_items[0]
+            return self._estimate_single_model_cost(
+                task_type, model_name, total_input_tokens, estimated_output_tokens
+            )
         
-        for task_type, model_name in model_strategy.items():
-            if model_name in self.pricing:
-                pricing = self.pricing[model_name]
-                
-                # Estimate portion of document for this task
-                task_portion = self._estimate_task_portion(task_type)
-                task_input_tokens = int(total_input_tokens * task_portion)
-                task_output_tokens = int(estimated_output_tokens * task_portion)
-                
-                cost = pricing.calculate_cost(task_input_tokens, task_output_tokens)
-                cost_breakdown[f"{task_type}_{model_name}"] = cost
-                total_cost += cost
+        # Calculate costs per model in one vectorized pass
+        tasks = [
+            (task_type, model_name)
+            for task_type, model_name in strategy_items
+            if model_name in self._model_idx
+        ]
+        idx = np.fromiter(
+            (self._model_idx[model_name] for _, model_name in tasks),
+            dtype=np.intp,
+            count=len(tasks)
+        )
+        portions = np.fromiter(
+            (_TASK_PORTIONS.get(task_type, 0.2) for task_type, _ in tasks),
+            dtype=np.float64,
+            count=len(tasks)
+        )
+        provider_totals = np.zeros(len(self._provider_names), dtype=np.float64)
         
-        cost_breakdown["total"] = total_cost
+        if CYTHON_AVAILABLE:
+            costs = np.asarray(cost_calculator_ext.task_cost_kernel(
+                total_input_tokens,
+                estimated_output_tokens,
+                portions,
+                idx,
+                self._in_per_tok,
+                self._out_per_tok,
+                self._providers,
+                provider_totals
+            ))
+        else:
+            task_input_tokens = (total_input_tokens * portions).astype(np.int64)
+            task_output_tokens = (estimated_output_tokens * portions).astype(np.int64)
+            costs = (
+                task_input_tokens * self._in_per_tok[idx]
+                + task_output_tokens * self._out_per_tok[idx]
+            )
+            np.add.at(provider_totals, self._providers[idx], costs)
+        
+        cost_breakdown = {
+            "by_task": {
+                task_type: {"model": model_name, "cost": cost}
+                for (task_type, model_name), cost in zip(tasks, costs.tolist())
+            },
+            "total": float(costs.sum())
+        }
         
         # Add breakdown by provider
-        provider_costs = {}
-        for model_name, pricing in self.pricing.items():
-            provider = pricing.provider
-            if provider not in provider_costs:
-                provider_costs[provider] = 0.0
-                
-        for key, cost in cost_breakdown.items():
-            if key != "total":
-                model_name = key.split("_", 1)[1]
-                if model_name in self.pricing:
-                    provider = self.pricing[model_name].provider
-                    provider_costs[provider] += cost
-                    
+        provider_costs = dict(zip(self._provider_names, provider_totals.tolist()))
+        
         cost_breakdown["by_provider"] = provider_costs
         
         return cost_breakdown
     
+    def _estimate_single_model_cost(
+        self,
+        task_type: str,
+        model_name: str,
+        total_input_tokens: int,
+        estimated_output_tokens: int
+    ) -> Dict[str, float]:
+        """Scalar cost breakdown for the common single-task strategy."""
+        provider_costs = dict.fromkeys(self._provider_names, 0.0)
+        pricing = self.pricing.get(model_name)
+        if pricing is None:
+            return {"by_task": {}, "total": 0.0, "by_provider": provider_costs}
+            
+        portion = _TASK_PORTIONS.get(task_type, 0.2)
+        cost = pricing.calculate_cost(
+            int(total_input_tokens * portion),
+            int(estimated_output_tokens * portion)
+        )
+        provider_costs[pricing.provider] = cost
+        
+        return {
+            "by_task": {task_type: {"model": model_name, "cost": cost}},
+            "total": cost,
+            "by_provider": provider_costs
+        }
+    
     def _estimate_task_portion(self, task_type: str) -> float:
         """Estimate what portion of document processing a task represents."""
-        task_portions = {
-            "outline": 0.05,
-            "summary": 0.10,
-            "main_processing": 0.70,
-            "refinement": 0.10,
-            "formatting": 0.05
-        }
-        return task_portions.get(task_type, 0.2)
+        return _TASK_PORTIONS.get(task_type, 0.2)
     
     def calculate_chunk_cost(
         self,
@@ -178,28 +436,75 @@ class CostCalculator:
         estimated_output_tokens: Optional[int] = None
     ) -> float:
         """Calculate cost for processing a single chunk."""
+        model_name = sys.intern(model_name)
+        
+        if estimated_output_tokens is None:
+            # Default estimate based on chunk type
+            chunk_type = chunk.metadata.get("type", "general")
+            if chunk_type not in _CHUNK_OUTPUT_RATIO_BY_TYPE:
+                chunk_type = "general"
+            cost_fn = self._chunk_cost_fns.get((model_name, chunk_type))
+            if cost_fn is None:
+                if model_name not in self.pricing:
+                    logger.warning(f"Unknown model: {model_name}")
+                    return 0.0
+                cost_fn = self._specialize_chunk_cost(model_name, chunk_type)
+            return cost_fn(chunk.word_count)
+            
         if model_name not in self.pricing:
             logger.warning(f"Unknown model: {model_name}")
             return 0.0
             
-        pricing = self.pricing[model_name]
-        
         # Estimate tokens
-        input_tokens = int(chunk.word_count * 1.33)
+        input_tokens = (chunk.word_count * _TOKENS_PER_WORD_Q10) >> 10
+        return self.pricing[model_name].calculate_cost(input_tokens, estimated_output_tokens)
+    
+    def _specialize_chunk_cost(self, model_name: str, chunk_type: str) -> Callable[[int], float]:
+        """Build and cache a chunk cost function with prices and ratio folded in."""
+        pricing = self.pricing[model_name]
+        in_per_tok = pricing.input_cost_per_token
+        out_per_tok = pricing.output_cost_per_token
+        ratio = _CHUNK_OUTPUT_RATIO_BY_TYPE[chunk_type]
         
-        if estimated_output_tokens is None:
-            # Default estimate based on chunk type
-            chunk_type = chunk.metadata.get("type", "general")
-            output_ratios = {
-                "summary": 0.2,
-                "scene": 1.5,
-                "dialogue": 1.2,
-                "general": 1.0
-            }
-            ratio = output_ratios.get(chunk_type, 1.0)
-            estimated_output_tokens = int(input_tokens * ratio)
+        def cost_fn(word_count: int) -> float:
+            input_tokens = (word_count * _TOKENS_PER_WORD_Q10) >> 10
+            return input_tokens * in_per_tok + int(input_tokens * ratio) * out_per_tok
             
-        return pricing.calculate_cost(input_tokens, estimated_output_tokens)
+        self._chunk_cost_fns[(model_name, chunk_type)] = cost_fn
+        return cost_fn
+    
+    def calculate_chunk_costs_batch(
+        self,
+        chunks: List[DocumentChunk],
+        model_name: str
+    ) -> np.ndarray:
+        """Calculate default-estimate costs for many chunks in one kernel call."""
+        if model_name not in self.pricing:
+            logger.warning(f"Unknown model: {model_name}")
+            return np.zeros(len(chunks), dtype=np.float64)
+            
+        pricing = self.pricing[model_name]
+        general_id = _CHUNK_TYPE_IDS["general"]
+        
+        word_counts = np.fromiter(
+            (chunk.word_count for chunk in chunks), dtype=np.int64, count=len(chunks)
+        )
+        type_ids = np.fromiter(
+            (
+                _CHUNK_TYPE_IDS.get(chunk.metadata.get("type", "general"), general_id)
+                for chunk in chunks
+            ),
+            dtype=np.int64,
+            count=len(chunks)
+        )
+        
+        return np.asarray(_chunk_cost_kernel(
+            word_counts,
+            type_ids,
+            pricing.input_cost_per_token,
+            pricing.output_cost_per_token,
+            _CHUNK_OUTPUT_RATIOS
+        ))
     
     def track_usage(
         self,
@@ -211,27 +516,214 @@ class CostCalculator:
         chunk_id: Optional[str] = None
     ):
         """Track model usage for analytics."""
-        usage_record = {
-            "timestamp": datetime.now(),
-            "model": model_name,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": input_tokens + output_tokens,
-            "cost": cost,
-            "document_id": document_id,
-            "chunk_id": chunk_id
-        }
-        self.usage_history.append(usage_record)
+        model_name = sys.intern(model_name)
+        now = time.time()
+        n = self._usage_n
+        usage = self._usage
+        row = n
+        if n == len(usage["ts"]):
+            if n >= self._usage_max:
+                # Full: overwrite the oldest row in place
+                row = self._usage_head
+                self._evict_usage_row(row)
+                self._usage_head = (row + 1) % n
+                n -= 1
+            else:
+                # Grow every column geometrically up to the retention cap
+                capacity = min(2 * n, self._usage_max)
+                for column, values in usage.items():
+                    grown = np.empty(capacity, dtype=values.dtype)
+                    grown[:n] = values
+                    usage[column] = grown
+                
+        usage["ts"][row] = now
+        usage["in"][row] = input_tokens
+        usage["out"][row] = output_tokens
+        usage["cost"][row] = cost
+        usage["model_id"][row] = self._intern_code(
+            model_name, self._usage_models, self._usage_model_ids
+        )
+        usage["doc_id"][row] = self._intern_code(
+            document_id, self._usage_docs, self._usage_doc_ids
+        )
+        usage["chunk_id"][row] = chunk_id
+        self._usage_n = n + 1
+        
+        # Drop interned values no retained row refers to any more
+        for column, values, ids in (
+            ("model_id", self._usage_models, self._usage_model_ids),
+            ("doc_id", self._usage_docs, self._usage_doc_ids)
+        ):
+            if len(values) > 2 * self._usage_max:
+                self._compact_codes(column, values, ids)
+        
+        # Update running aggregates for the current hour
+        hour = int(now // USAGE_BUCKET_SECONDS)
+        if not self._hourly_buckets or self._hourly_buckets[-1]["hour"] != hour:
+            self._hourly_buckets.append({
+                "hour": hour,
+                "count": 0,
+                "cost": 0.0,
+                "tokens": 0,
+                "models": {},
+                "documents": {}
+            })
+        bucket = self._hourly_buckets[-1]
+        total_tokens = input_tokens + output_tokens
+        bucket["count"] += 1
+        bucket["cost"] += cost
+        bucket["tokens"] += total_tokens
+        bucket["documents"][document_id] = bucket["documents"].get(document_id, 0) + 1
+        
+        model_stats = bucket["models"].get(model_name)
+        if model_stats is None:
+            model_stats = bucket["models"][model_name] = {"count": 0, "cost": 0.0, "tokens": 0}
+        model_stats["count"] += 1
+        model_stats["cost"] += cost
+        model_stats["tokens"] += total_tokens
+    
+    def _evict_usage_row(self, row: int):
+        """Remove a row that is about to be overwritten from the hourly aggregates."""
+        usage = self._usage
+        buckets = self._hourly_buckets
+        hour = int(usage["ts"][row] // USAGE_BUCKET_SECONDS)
+        if not buckets or buckets[0]["hour"] != hour:
+            # Its bucket has already aged out
+            return
+        
+        bucket = buckets[0]
+        bucket["count"] -= 1
+        if not bucket["count"]:
+            buckets.popleft()
+            return
+        
+        cost = float(usage["cost"][row])
+        total_tokens = int(usage["in"][row] + usage["out"][row])
+        bucket["cost"] -= cost
+        bucket["tokens"] -= total_tokens
+        
+        document_id = self._usage_docs[usage["doc_id"][row]]
+        documents = bucket["documents"]
+        documents[document_id] -= 1
+        if not documents[document_id]:
+            del documents[document_id]
+        
+        model_name = self._usage_models[usage["model_id"][row]]
+        model_stats = bucket["models"][model_name]
+        model_stats["count"] -= 1
+        if not model_stats["count"]:
+            del bucket["models"][model_name]
+        else:
+            model_stats["cost"] -= cost
+            model_stats["tokens"] -= total_tokens
         
     def get_usage_summary(self, time_period_hours: int = 24) -> Dict[str, any]:
         """Get usage summary for specified time period."""
-        cutoff_time = datetime.now().timestamp() - (time_period_hours * 3600)
-        recent_usage = [
-            u for u in self.usage_history 
-            if u["timestamp"].timestamp() > cutoff_time
-        ]
+        cutoff_time = time.time() - (time_period_hours * 3600)
+        cutoff_hour = int(cutoff_time // USAGE_BUCKET_SECONDS)
+        buckets = self._hourly_buckets
         
-        if not recent_usage:
+        if len(buckets) == buckets.maxlen and buckets[0]["hour"] > cutoff_hour:
+            # Window reaches past bucket retention; fall back to raw history
+            return self._summarize_usage_history(cutoff_time)
+        
+        # The hour the cutoff falls in is only partly inside the window, so
+        # it is summed from the raw records; later hours come from buckets
+        usage_count, total_cost, total_tokens, model_breakdown, documents = self._aggregate_usage(
+            self._usage_window(cutoff_time, (cutoff_hour + 1) * USAGE_BUCKET_SECONDS)
+        )
+        
+        for bucket in reversed(buckets):
+            if bucket["hour"] <= cutoff_hour:
+                break
+            usage_count += bucket["count"]
+            total_cost += bucket["cost"]
+            total_tokens += bucket["tokens"]
+            documents.update(bucket["documents"])
+            
+            for model, stats in bucket["models"].items():
+                if model not in model_breakdown:
+                    model_breakdown[model] = {
+                        "count": 0,
+                        "cost": 0.0,
+                        "tokens": 0
+                    }
+                model_breakdown[model]["count"] += stats["count"]
+                model_breakdown[model]["cost"] += stats["cost"]
+                model_breakdown[model]["tokens"] += stats["tokens"]
+        
+        return self._format_usage_summary(
+            usage_count, total_cost, total_tokens, model_breakdown, len(documents)
+        )
+    
+    def _summarize_usage_history(self, cutoff_time: float) -> Dict[str, any]:
+        """Summarize raw usage records newer than cutoff_time."""
+        usage_count, total_cost, total_tokens, model_breakdown, documents = self._aggregate_usage(
+            self._usage_window(cutoff_time)
+        )
+        return self._format_usage_summary(
+            usage_count, total_cost, total_tokens, model_breakdown, len(documents)
+        )
+    
+    def _usage_window(self, after: float, before: float = float("inf")) -> Dict[str, np.ndarray]:
+        """Columns of the raw records with after < timestamp < before, oldest first."""
+        n = self._usage_n
+        head = self._usage_head
+        timestamps = self._usage["ts"]
+        
+        # Records are appended in time order, so each run of the ring is sorted
+        ranges = []
+        for low, high in ((head, n), (0, head)) if head else ((0, n),):
+            run = timestamps[low:high]
+            start = low + int(np.searchsorted(run, after, side="right"))
+            end = low + int(np.searchsorted(run, before, side="left"))
+            if start < end:
+                ranges.append((start, end))
+        
+        if len(ranges) == 2:
+            return {
+                column: np.concatenate([values[start:end] for start, end in ranges])
+                for column, values in self._usage.items()
+            }
+        start, end = ranges[0] if ranges else (0, 0)
+        return {column: values[start:end] for column, values in self._usage.items()}
+    
+    def _aggregate_usage(self, usage: Dict[str, np.ndarray]) -> Tuple[int, float, int, Dict, set]:
+        """Count, cost, tokens, model breakdown and document ids of raw records."""
+        costs = usage["cost"]
+        tokens = usage["in"] + usage["out"]
+        model_ids = usage["model_id"]
+        
+        # Model breakdown
+        model_count = len(self._usage_models)
+        counts = np.bincount(model_ids, minlength=model_count)
+        model_costs = np.bincount(model_ids, weights=costs, minlength=model_count)
+        model_tokens = np.bincount(model_ids, weights=tokens, minlength=model_count)
+        model_breakdown = {
+            self._usage_models[model_id]: {
+                "count": int(counts[model_id]),
+                "cost": float(model_costs[model_id]),
+                "tokens": int(model_tokens[model_id])
+            }
+            for model_id in np.flatnonzero(counts).tolist()
+        }
+        
+        documents = {
+            self._usage_docs[doc_id] for doc_id in np.unique(usage["doc_id"]).tolist()
+        }
+        
+        return len(costs), float(costs.sum()), int(tokens.sum()), model_breakdown, documents
+    
+    def _format_usage_summary(
+        self,
+        usage_count: int,
+        total_cost: float,
+        total_tokens: int,
+        model_breakdown: Dict[str, Dict[str, float]],
+        document_count: int
+    ) -> Dict[str, any]:
+        """Shape aggregated usage into the summary returned to callers."""
+        if not usage_count:
             return {
                 "total_cost": 0.0,
                 "total_tokens": 0,
@@ -239,34 +731,13 @@ class CostCalculator:
                 "document_count": 0
             }
         
-        # Calculate totals
-        total_cost = sum(u["cost"] for u in recent_usage)
-        total_tokens = sum(u["total_tokens"] for u in recent_usage)
-        
-        # Model breakdown
-        model_breakdown = {}
-        for usage in recent_usage:
-            model = usage["model"]
-            if model not in model_breakdown:
-                model_breakdown[model] = {
-                    "count": 0,
-                    "cost": 0.0,
-                    "tokens": 0
-                }
-            model_breakdown[model]["count"] += 1
-            model_breakdown[model]["cost"] += usage["cost"]
-            model_breakdown[model]["tokens"] += usage["total_tokens"]
-        
-        # Document count
-        unique_documents = len(set(u["document_id"] for u in recent_usage))
-        
         return {
             "total_cost": round(total_cost, 4),
             "total_tokens": total_tokens,
             "model_breakdown": model_breakdown,
-            "document_count": unique_documents,
-            "usage_count": len(recent_usage),
-            "average_cost_per_use": round(total_cost / len(recent_usage), 4) if recent_usage else 0
+            "document_count": document_count,
+            "usage_count": usage_count,
+            "average_cost_per_use": round(total_cost / usage_count, 4)
         }
     
     def optimize_model_selection(
@@ -286,22 +757,9 @@ class CostCalculator:
         Returns:
             Optimal model name or None if no match
         """
-        from src.infrastructure.document_processing.orchestrators.model_orchestrator import ModelCapability
-        
-        candidates = []
-        
-        # Filter by budget
-        for model_name, pricing in self.pricing.items():
-            avg_cost = (pricing.input_cost_per_1k + pricing.output_cost_per_1k) / 2
-            if avg_cost <= budget_per_1k_tokens:
-                candidates.append(model_name)
-        
-        if not candidates:
-            return None
-            
-        # Sort by cost-effectiveness
-        candidates.sort(key=lambda m: (
-            self.pricing[m].input_cost_per_1k + self.pricing[m].output_cost_per_1k
-        ))
-        
-        return candidates[0] if candidates else None
+        # Cheapest first, so the first model within budget is the optimum
+        for total_cost_per_1k, model_name in self._by_cost:
+            if total_cost_per_1k / 2 <= budget_per_1k_tokens:
+                return model_name
+                
+        return None
@@ -0,0 +1,64 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# src/infrastructure/document_processing/orchestrators/cost_calculator_ext.pyx
+
+"""Compiled numeric kernels for CostCalculator (optional extension)."""
+
+from libc.math cimport floor
+from libc.stdint cimport int64_t
+from cpython.array cimport array, clone
+
+# Tokens per word (1.33) in Q10 fixed point, matching cost_calculator
+cdef enum:
+    TOKENS_PER_WORD_Q10 = 1362
+
+cdef array _DOUBLE_TEMPLATE = array("d")
+
+
+def chunk_cost_kernel(
+    const int64_t[:] word_counts,
+    const int64_t[:] type_ids,
+    double in_per_tok,
+    double out_per_tok,
+    const double[:] ratios
+):
+    """Price a batch of chunks from their word counts and type ids."""
+    cdef Py_ssize_t i, n = word_counts.shape[0]
+    cdef array costs = clone(_DOUBLE_TEMPLATE, n, zero=False)
+    cdef double[::1] out = costs
+    cdef int64_t input_tokens
+    
+    with nogil:
+        for i in range(n):
+            input_tokens = (word_counts[i] * TOKENS_PER_WORD_Q10) >> 10
+            out[i] = (
+                input_tokens * in_per_tok
+                + floor(input_tokens * ratios[type_ids[i]]) * out_per_tok
+            )
+    return costs
+
+
+def task_cost_kernel(
+    int64_t total_input_tokens,
+    int64_t estimated_output_tokens,
+    const double[:] portions,
+    const Py_ssize_t[:] idx,
+    const double[:] in_per_tok,
+    const double[:] out_per_tok,
+    const Py_ssize_t[:] providers,
+    double[:] provider_totals
+):
+    """Per-task costs for a strategy; accumulates provider totals in place."""
+    cdef Py_ssize_t i, n = idx.shape[0]
+    cdef array costs = clone(_DOUBLE_TEMPLATE, n, zero=False)
+    cdef double[::1] out = costs
+    cdef double cost
+    
+    with nogil:
+        for i in range(n):
+            cost = (
+                <int64_t>(total_input_tokens * portions[i]) * in_per_tok[idx[i]]
+                + <int64_t>(estimated_output_tokens * portions[i]) * out_per_tok[idx[i]]
+            )
+            out[i] = cost
+            provider_totals[providers[idx[i]]] += cost
+    return costs
@@ -1,18 +1,74 @@
 # src/infrastructure/document_processing/orchestrators/model_orchestrator.py
 
 import asyncio
+import functools
+import hashlib
+import heapq
+import os
+import re
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import time
 
 from src.core.models.document import Document, DocumentChunk, ChunkProcessingResult
 from src.core.utils.logger import Logger
+from src.core.utils.circuit_breaker import CircuitBreaker, CircuitState
 from src.infrastructure.llm.llm_factory import LLMFactory
 from src.infrastructure.document_processing.orchestrators.cost_calculator import CostCalculator
+from src.infrastructure.document_processing.cache.result_store import ResultStore
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 logger = Logger(__name__)
 
+# Content-analysis indicators, matched as plain substrings of casefolded text
+_COMPLEX_INDICATORS = re.compile(
+    "analyze|compare|evaluate|synthesize|therefore|however|consequently|thus"
+)
+_CREATIVE_INDICATORS = re.compile(
+    "story|narrative|character|dialogue|imagine|describe|scene|emotion"
+)
+
+
+def _has_distinct_matches(pattern: re.Pattern, text: str, minimum: int = 2) -> bool:
+    """Check whether at least `minimum` different indicators occur in text."""
+    seen = set()
+    for match in pattern.finditer(text):
+        seen.add(match.group())
+        if len(seen) >= minimum:
+            return True
+    return False
+
+
+# Packages whose exceptions report a provider or transport problem
+_PROVIDER_ERROR_MODULES = ("openai", "anthropic", "httpx", "httpcore", "aiohttp")
+
+
+def _is_provider_error(error: BaseException) -> bool:
+    """Check whether an error says the provider failed, rather than our own code."""
+    if isinstance(error, (OSError, asyncio.TimeoutError)):
+        return True
+    return type(error).__module__.partition(".")[0] in _PROVIDER_ERROR_MODULES
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding():
+    """Load the tiktoken encoding on first use, or None to fall back to word counts."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # The BPE file is fetched on first use and may be unreachable
+        logger.warning("tiktoken encoding unavailable, estimating from words: %s", e)
+        return None
+
 
 class ModelCapability(Enum):
     """Model capabilities for task assignment."""
@@ -24,6 +80,84 @@ class ModelCapability(Enum):
     SIMPLE = "simple"
 
 
+# Format-specific capability mapping
+_FORMAT_CAPABILITIES = {
+    "podcast": {
+        "chapter": ModelCapability.CREATIVE,
+        "scene": ModelCapability.CREATIVE,
+        "dialogue": ModelCapability.CREATIVE,
+        "general": ModelCapability.SUMMARY
+    },
+    "course": {
+        "theoretical": ModelCapability.REASONING,
+        "practical": ModelCapability.EXTRACTION,
+        "exercise": ModelCapability.CREATIVE,
+        "general": ModelCapability.SUMMARY
+    },
+    "video": {
+        "narrative": ModelCapability.CREATIVE,
+        "technical": ModelCapability.EXTRACTION,
+        "general": ModelCapability.SUMMARY
+    },
+    "translation": {
+        "all": ModelCapability.TRANSLATION
+    }
+}
+
+# Format-specific task configs
+_FORMAT_CONFIGS = {
+    "podcast": {
+        "style": "conversational",
+        "tone": "engaging",
+        "structure": "episode_segment"
+    },
+    "course": {
+        "style": "educational",
+        "tone": "clear",
+        "structure": "lesson"
+    },
+    "video": {
+        "style": "visual",
+        "tone": "dynamic",
+        "structure": "scene"
+    }
+}
+
+# Average output tokens assumed when estimating chunk cost
+AVERAGE_OUTPUT_TOKENS = 500
+
+# Chunk prompt templates by output structure
+_PROMPT_TEMPLATES = {
+    "episode_segment": """
+Transform this content into a podcast episode segment. Make it conversational and engaging.
+Include natural transitions and speaking cues.
+
+Content:
+{content}
+""",
+    "lesson": """
+Transform this content into an educational lesson segment.
+Make it clear and structured with learning objectives.
+
+Content:
+{content}
+""",
+    "scene": """
+Transform this content into a video script scene.
+Include visual descriptions and pacing notes.
+
+Content:
+{content}
+""",
+    "general": """
+Process and optimize this content maintaining its key information.
+
+Content:
+{content}
+"""
+}
+
+
 @dataclass
 class ModelProfile:
     """Profile of an AI model with capabilities and costs."""
@@ -34,20 +168,46 @@ class ModelProfile:
     max_tokens: int
     speed_rating: int  # 1-10, 10 being fastest
     quality_rating: int  # 1-10, 10 being best
+    efficiency_score: float = field(init=False, repr=False, compare=False)
     
-    @property
-    def efficiency_score(self) -> float:
-        """Calculate efficiency score (quality/cost ratio)."""
-        return (self.quality_rating * self.speed_rating) / self.cost_per_1k_tokens
+    def __post_init__(self):
+        # Efficiency score (quality/cost ratio), fixed for the profile's lifetime
+        self.efficiency_score = (
+            (self.quality_rating * self.speed_rating) / self.cost_per_1k_tokens
+        )
 
 
 class ModelOrchestrator:
     """Orchestrate multiple AI models for optimal processing."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        result_cache_size: int = 1024,
+        result_store_path: Optional[str] = None
+    ):
         self.llm_factory = LLMFactory()
+        self.max_in_flight = max_in_flight  # Concurrent chunk requests
+        self.result_cache_size = result_cache_size
+        self._result_cache = OrderedDict()  # LRU of request key -> response, across documents
+        self._result_store = self._open_result_store(
+            result_store_path or os.getenv("ORCHESTRATOR_RESULT_STORE")
+        )
+        self._provider_clients: Dict[str, Any] = {}  # Created lazily, reused across documents
+        self._breakers: Dict[str, CircuitBreaker] = {}  # Per-provider failure circuits
+        self._lower_cache: Dict[int, str] = {}  # id(chunk) -> casefolded content, per document
+        self._token_cache: Dict[int, int] = {}  # id(chunk) -> input tokens, per document
         self.cost_calculator = CostCalculator()
         self.model_profiles = self._initialize_model_profiles()
+        # Capable model names per capability, most efficient first
+        self._by_capability: Dict[ModelCapability, List[str]] = {
+            capability: sorted(
+                (name for name, profile in self.model_profiles.items()
+                 if capability in profile.capabilities),
+                key=lambda name: -self.model_profiles[name].efficiency_score
+            )
+            for capability in ModelCapability
+        }
         self.processing_stats = {
             "total_chunks": 0,
             "successful_chunks": 0,
@@ -130,18 +290,23 @@ class ModelOrchestrator:
         Returns:
             List of chunk processing results
         """
-        # Create processing plan
-        processing_plan = await self._create_processing_plan(
-            chunks, 
-            output_format,
-            budget_limit
-        )
-        
-        # Log plan
-        logger.info(f"Processing plan created: {len(processing_plan)} tasks")
-        
-        # Process chunks in parallel batches
-        results = await self._process_chunks_parallel(processing_plan)
+        try:
+            # Create processing plan
+            processing_plan = await self._create_processing_plan(
+                chunks, 
+                output_format,
+                budget_limit
+            )
+            
+            # Log plan
+            logger.info("Processing plan created: %d tasks", len(processing_plan))
+            
+            # Process chunks in parallel batches
+            results = await self._process_chunks_parallel(processing_plan)
+        finally:
+            # Chunk ids are only stable while this document's chunks are alive
+            self._lower_cache.clear()
+            self._token_cache.clear()
         
         # Update stats
         self._update_processing_stats(results)
@@ -157,152 +322,121 @@ class ModelOrchestrator:
         """Create optimal processing plan for chunks."""
         plan = []
         estimated_cost = 0.0
+        profiles = self.model_profiles
+        by_capability = self._by_capability
+        task_settings = {}  # capability -> chunk-independent task settings
+        
+        # Phase 1: tag the required capability of every chunk
+        capabilities = self._determine_capabilities(chunks, output_format)
         
-        for chunk in chunks:
-            # Determine required capability
-            capability = self._determine_capability(chunk, output_format)
+        # Phase 2: greedy, budget-aware model assignment, config and cost in one pass
+        for chunk, capability in zip(chunks, capabilities):
+            # Estimate tokens (input + average output)
+            total_tokens = self._input_tokens(chunk) + AVERAGE_OUTPUT_TOKENS
             
-            # Select optimal model
-            model_name = self._select_optimal_model(
-                capability,
-                chunk,
-                budget_limit - estimated_cost if budget_limit else None
-            )
+            # Select optimal model; capable models are sorted by efficiency score
+            capable_models = by_capability[capability]
+            if not capable_models:
+                # Fallback to GPT-3.5
+                model_name = "gpt-3.5-turbo"
+            elif budget_limit:
+                remaining_budget = budget_limit - estimated_cost
+                for model_name in capable_models:
+                    if (total_tokens / 1000) * profiles[model_name].cost_per_1k_tokens <= remaining_budget:
+                        break
+                else:
+                    # If all exceed budget, use cheapest
+                    model_name = min(
+                        capable_models,
+                        key=lambda name: profiles[name].cost_per_1k_tokens
+                    )
+            else:
+                # Most efficient model
+                model_name = capable_models[0]
             
             # Create task config
-            task_config = self._create_task_config(chunk, output_format, capability)
+            settings = task_settings.get(capability)
+            if settings is None:
+                settings = task_settings[capability] = self._create_task_settings(
+                    output_format, capability
+                )
+            metadata = chunk.metadata
+            task_config = {
+                **settings,
+                "chunk_context": {
+                    "type": metadata.get("type", "general"),
+                    "index": metadata.get("index", 0),
+                    "total_chunks": metadata.get("total_chunks", 1)
+                }
+            }
             
             # Estimate cost
-            chunk_cost = self._estimate_chunk_cost(chunk, model_name)
-            estimated_cost += chunk_cost
+            profile = profiles.get(model_name)
+            if profile is not None:
+                estimated_cost += (total_tokens / 1000) * profile.cost_per_1k_tokens
             
             plan.append((chunk, model_name, task_config))
             
             # Check budget
             if budget_limit and estimated_cost > budget_limit:
-                logger.warning(f"Budget limit reached. Planned {len(plan)} of {len(chunks)} chunks")
+                logger.warning(
+                    "Budget limit reached. Planned %d of %d chunks", len(plan), len(chunks)
+                )
                 break
                 
         return plan
     
+    def _determine_capabilities(
+        self,
+        chunks: List[DocumentChunk],
+        output_format: str
+    ) -> List[ModelCapability]:
+        """Determine required capabilities for all chunks in one pass."""
+        format_map = _FORMAT_CAPABILITIES.get(output_format)
+        
+        # Whole-format capability needs no per-chunk work
+        if format_map is not None and "all" in format_map:
+            return [format_map["all"]] * len(chunks)
+        
+        return [self._determine_capability(chunk, output_format) for chunk in chunks]
+    
     def _determine_capability(
         self,
         chunk: DocumentChunk,
         output_format: str
     ) -> ModelCapability:
         """Determine required capability based on chunk and output format."""
-        chunk_type = chunk.metadata.get("type", "general")
-        
-        # Format-specific capability mapping
-        format_capability_map = {
-            "podcast": {
-                "chapter": ModelCapability.CREATIVE,
-                "scene": ModelCapability.CREATIVE,
-                "dialogue": ModelCapability.CREATIVE,
-                "general": ModelCapability.SUMMARY
-            },
-            "course": {
-                "theoretical": ModelCapability.REASONING,
-                "practical": ModelCapability.EXTRACTION,
-                "exercise": ModelCapability.CREATIVE,
-                "general": ModelCapability.SUMMARY
-            },
-            "video": {
-                "narrative": ModelCapability.CREATIVE,
-                "technical": ModelCapability.EXTRACTION,
-                "general": ModelCapability.SUMMARY
-            },
-            "translation": {
-                "all": ModelCapability.TRANSLATION
-            }
-        }
-        
         # Get capability for format and chunk type
-        if output_format in format_capability_map:
-            format_map = format_capability_map[output_format]
+        format_map = _FORMAT_CAPABILITIES.get(output_format)
+        if format_map is not None:
+            chunk_type = chunk.metadata.get("type", "general")
             if chunk_type in format_map:
                 return format_map[chunk_type]
             elif "all" in format_map:
                 return format_map["all"]
                 
         # Default capability based on content analysis
-        if self._is_complex_content(chunk.content):
+        content = self._lowered(chunk)
+        if self._is_complex_content(content):
             return ModelCapability.REASONING
-        elif self._is_creative_content(chunk.content):
+        elif self._is_creative_content(content):
             return ModelCapability.CREATIVE
         else:
             return ModelCapability.SIMPLE
     
-    def _select_optimal_model(
-        self,
-        capability: ModelCapability,
-        chunk: DocumentChunk,
-        remaining_budget: Optional[float] = None
-    ) -> str:
-        """Select optimal model based on capability and constraints."""
-        # Filter models by capability
-        capable_models = [
-            (name, profile) for name, profile in self.model_profiles.items()
-            if capability in profile.capabilities
-        ]
-        
-        if not capable_models:
-            # Fallback to GPT-3.5
-            return "gpt-3.5-turbo"
-        
-        # Sort by efficiency score
-        capable_models.sort(key=lambda x: x[1].efficiency_score, reverse=True)
-        
-        # Check budget constraints
-        if remaining_budget is not None:
-            for name, profile in capable_models:
-                estimated_cost = self._estimate_chunk_cost(chunk, name)
-                if estimated_cost <= remaining_budget:
-                    return name
-            # If all exceed budget, use cheapest
-            return min(capable_models, key=lambda x: x[1].cost_per_1k_tokens)[0]
-        
-        # Return most efficient model
-        return capable_models[0][0]
-    
-    def _create_task_config(
+    def _create_task_settings(
         self,
-        chunk: DocumentChunk,
         output_format: str,
         capability: ModelCapability
     ) -> Dict[str, Any]:
-        """Create task-specific configuration."""
+        """Create task settings shared by all chunks of a format and capability."""
         base_config = {
             "temperature": 0.7,
-            "max_tokens": 2000,
-            "chunk_context": {
-                "type": chunk.metadata.get("type", "general"),
-                "index": chunk.metadata.get("index", 0),
-                "total_chunks": chunk.metadata.get("total_chunks", 1)
-            }
-        }
-        
-        # Format-specific configs
-        format_configs = {
-            "podcast": {
-                "style": "conversational",
-                "tone": "engaging",
-                "structure": "episode_segment"
-            },
-            "course": {
-                "style": "educational",
-                "tone": "clear",
-                "structure": "lesson"
-            },
-            "video": {
-                "style": "visual",
-                "tone": "dynamic",
-                "structure": "scene"
-            }
+            "max_tokens": 2000
         }
         
-        if output_format in format_configs:
-            base_config.update(format_configs[output_format])
+        if output_format in _FORMAT_CONFIGS:
+            base_config.update(_FORMAT_CONFIGS[output_format])
             
         # Capability-specific adjustments
         if capability == ModelCapability.CREATIVE:
@@ -314,109 +448,179 @@ class ModelOrchestrator:
             
         return base_config
     
-    def _estimate_chunk_cost(self, chunk: DocumentChunk, model_name: str) -> float:
-        """Estimate processing cost for a chunk."""
-        if model_name not in self.model_profiles:
-            return 0.0
-            
-        profile = self.model_profiles[model_name]
-        
-        # Estimate tokens (input + output)
-        input_tokens = int(chunk.word_count * 1.33)  # Rough estimate
-        output_tokens = 500  # Average output
-        total_tokens = input_tokens + output_tokens
-        
-        # Calculate cost
-        cost = (total_tokens / 1000) * profile.cost_per_1k_tokens
-        
-        return cost
-    
     async def _process_chunks_parallel(
         self,
         processing_plan: List[Tuple[DocumentChunk, str, Dict[str, Any]]]
     ) -> List[ChunkProcessingResult]:
-        """Process chunks in parallel batches."""
-        results = []
-        batch_size = 5  # Process 5 chunks at a time
+        """Process chunks concurrently, shortest first, admitting a new one as soon as any finishes."""
+        results: List[Optional[ChunkProcessingResult]] = [None] * len(processing_plan)
         
-        for i in range(0, len(processing_plan), batch_size):
-            batch = processing_plan[i:i + batch_size]
-            
-            # Create tasks for batch
-            tasks = []
-            for chunk, model_name, config in batch:
-                task = self._process_single_chunk(chunk, model_name, config)
-                tasks.append(task)
-            
-            # Process batch
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Handle results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Chunk processing failed: {str(result)}")
+        # One provider client per model, shared by all of its chunks
+        clients = {}
+        for model_name in {model_name for _, model_name, _ in processing_plan}:
+            try:
+                clients[model_name] = self._get_provider_client(
+                    self.model_profiles[model_name].provider
+                )
+            except Exception:
+                # Let each chunk surface the error through its own result
+                clients[model_name] = None
+        
+        # Coalesce identical requests (repeated headers, boilerplate) into one dispatch
+        groups: Dict[Tuple, List[int]] = {}
+        for index, (chunk, model_name, config) in enumerate(processing_plan):
+            groups.setdefault(self._request_key(chunk, model_name, config), []).append(index)
+        
+        # Min-heap on input tokens so short requests drain first
+        queue = [
+            (self._input_tokens(processing_plan[members[0]][0]), members[0], request_key)
+            for request_key, members in groups.items()
+        ]
+        heapq.heapify(queue)
+        
+        async def worker():
+            while queue:
+                _, index, request_key = heapq.heappop(queue)
+                chunk, model_name, config = processing_plan[index]
+                try:
+                    result = await self._process_single_chunk(
+                        chunk, model_name, config, clients[model_name], request_key
+                    )
+                except Exception as e:
+                    logger.error("Chunk processing failed: %s", e)
                     # Create error result
-                    error_result = ChunkProcessingResult(
-                        chunk=batch[0][0],  # Get chunk from batch
+                    result = ChunkProcessingResult(
+                        chunk=chunk,
                         processed_content="",
-                        model_used="error",
+                        model_used=model_name,
                         tokens_used=0,
                         processing_time=0.0,
                         cost=0.0,
-                        error=str(result)
+                        error=str(e)
                     )
-                    results.append(error_result)
-                else:
-                    results.append(result)
-            
-            # Brief pause between batches
-            await asyncio.sleep(0.1)
+                results[index] = result
+                
+                # Fan the response out to duplicates; only the first one paid for it
+                for duplicate in groups[request_key][1:]:
+                    duplicate_chunk, _, duplicate_config = processing_plan[duplicate]
+                    results[duplicate] = replace(
+                        result,
+                        chunk=duplicate_chunk,
+                        tokens_used=0,
+                        cost=0.0,
+                        metadata={**result.metadata, "config": duplicate_config, "coalesced": True}
+                    )
+        
+        # max_in_flight workers keep that many requests running until the heap is empty
+        await asyncio.gather(*(
+            worker() for _ in range(min(self.max_in_flight, len(queue)))
+        ))
             
         return results
     
+    def _get_provider_client(self, provider: str):
+        """Return the cached LLM client for a provider, creating it on first use."""
+        if provider not in self._provider_clients:
+            self._provider_clients[provider] = self._create_provider_client(provider)
+        return self._provider_clients[provider]
+    
+    def _get_breaker(self, provider: str) -> CircuitBreaker:
+        """Get the circuit breaker guarding a provider."""
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = self._breakers[provider] = CircuitBreaker(
+                failure_threshold=int(os.getenv("PROVIDER_FAILURE_THRESHOLD", 5)),
+                recovery_timeout=float(os.getenv("PROVIDER_RECOVERY_TIMEOUT", 30))
+            )
+        return breaker
+    
+    def _create_provider_client(self, provider: str):
+        """Create the LLM client for a provider, or None if it has no client."""
+        if provider == "openai":
+            from src.infrastructure.llm.providers.openai_provider import OpenAIProvider
+            return OpenAIProvider()
+        elif provider == "anthropic":
+            from src.infrastructure.llm.providers.anthropic_provider import AnthropicProvider
+            return AnthropicProvider()
+        return None
+    
     async def _process_single_chunk(
         self,
         chunk: DocumentChunk,
         model_name: str,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        llm: Optional[Any] = None,
+        request_key: Optional[Tuple] = None
     ) -> ChunkProcessingResult:
         """Process a single chunk with specified model."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get model provider
             provider = self.model_profiles[model_name].provider
             
+            # Reuse a response from an earlier identical request
+            if request_key is None:
+                request_key = self._request_key(chunk, model_name, config)
+            cached = await self._lookup_result(request_key)
+            if cached is not None:
+                return ChunkProcessingResult(
+                    chunk=chunk,
+                    processed_content=cached,
+                    model_used=model_name,
+                    tokens_used=0,
+                    processing_time=time.perf_counter() - start_time,
+                    cost=0.0,
+                    metadata={
+                        "config": config,
+                        "provider": provider,
+                        "cached": True
+                    }
+                )
+            
             # Create prompt based on output format
             prompt = self._create_chunk_prompt(chunk, config)
             
             # Process with appropriate provider
-            if provider == "openai":
-                from src.infrastructure.llm.providers.openai_provider import OpenAIProvider
-                llm = OpenAIProvider()
-                response = await llm.translate(  # Using translate as generic process method
-                    prompt,
-                    target_language="",  # Not used for general processing
-                    model=model_name,
-                    temperature=config.get("temperature", 0.7),
-                    max_tokens=config.get("max_tokens", 2000)
-                )
-            elif provider == "anthropic":
-                from src.infrastructure.llm.providers.anthropic_provider import AnthropicProvider
-                llm = AnthropicProvider()
-                response = await llm.translate(
-                    prompt,
-                    target_language="",
-                    model=model_name,
-                    temperature=config.get("temperature", 0.7),
-                    max_tokens=config.get("max_tokens", 2000)
-                )
+            if llm is None:
+                llm = self._get_provider_client(provider)
+                
+            if llm is not None:
+                # Fail fast while the provider keeps failing
+                breaker = self._get_breaker(provider)
+                if not breaker.allow_request():
+                    raise RuntimeError(f"Provider {provider} unavailable (circuit open)")
+                probe = breaker.state is CircuitState.HALF_OPEN
+                
+                try:
+                    # Rate limiting happens in the provider client itself
+                    response = await llm.translate(  # Using translate as generic process method
+                        prompt,
+                        target_language="",  # Not used for general processing
+                        model=model_name,
+                        temperature=config.get("temperature", 0.7),
+                        max_tokens=config.get("max_tokens", 2000)
+                    )
+                except Exception as e:
+                    # Bugs such as a bad call signature must not take the provider offline
+                    if _is_provider_error(e):
+                        breaker.record_failure()
+                    raise
+                else:
+                    breaker.record_success()
+                finally:
+                    # Cancelled or non-provider errors must not hold the probe forever
+                    if probe:
+                        breaker.release_probe()
+                
+                await self._cache_result(request_key, response)
             else:
-                # Fallback to simple processing
+                # Fallback to simple processing; not cached, so a real response
+                # replaces it once the provider is available
                 response = await self._simple_process(chunk, config)
             
             # Calculate metrics
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             tokens_used = self._estimate_tokens_used(chunk, response)
             cost = self._calculate_actual_cost(model_name, tokens_used)
             
@@ -434,52 +638,89 @@ class ModelOrchestrator:
             )
             
         except Exception as e:
-            logger.error(f"Error processing chunk: {str(e)}")
+            logger.error("Error processing chunk: %s", e)
             return ChunkProcessingResult(
                 chunk=chunk,
                 processed_content="",
                 model_used=model_name,
                 tokens_used=0,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 cost=0.0,
                 error=str(e)
             )
     
+    def _request_key(
+        self,
+        chunk: DocumentChunk,
+        model_name: str,
+        config: Dict[str, Any]
+    ) -> Tuple:
+        """Key identifying an LLM request by content digest, model and settings."""
+        digest = hashlib.blake2b(chunk.content.encode(), digest_size=16).digest()
+        # chunk_context only locates the chunk in its document; it is not sent
+        settings = tuple(sorted(
+            (key, value) for key, value in config.items() if key != "chunk_context"
+        ))
+        return (digest, model_name, settings)
+    
+    def _open_result_store(self, path: Optional[str]) -> Optional[ResultStore]:
+        """Open the persistent result store, or None when not configured."""
+        if not path:
+            return None
+        try:
+            return ResultStore(path)
+        except Exception as e:
+            logger.warning("Result store unavailable, caching in memory only: %s", e)
+            return None
+    
+    def _store_key(self, request_key: Tuple) -> str:
+        """Stable string form of a request key for the persistent store."""
+        return hashlib.blake2b(repr(request_key).encode(), digest_size=16).hexdigest()
+    
+    async def _lookup_result(self, request_key: Tuple) -> Optional[str]:
+        """Find a cached response in memory, then in the persistent store."""
+        response = self._result_cache.get(request_key)
+        if response is not None:
+            self._result_cache.move_to_end(request_key)
+            return response
+        
+        if self._result_store is not None:
+            try:
+                # SQLite blocks; keep it off the event loop
+                response = await asyncio.to_thread(
+                    self._result_store.get, self._store_key(request_key)
+                )
+            except Exception as e:
+                logger.warning("Result store lookup failed: %s", e)
+                return None
+            if response is not None:
+                self._remember_result(request_key, response)
+        return response
+    
+    async def _cache_result(self, request_key: Tuple, response: str):
+        """Remember a provider response in memory and in the persistent store."""
+        self._remember_result(request_key, response)
+        
+        if self._result_store is not None:
+            try:
+                await asyncio.to_thread(
+                    self._result_store.set, self._store_key(request_key), response
+                )
+            except Exception as e:
+                logger.warning("Result store write failed: %s", e)
+    
+    def _remember_result(self, request_key: Tuple, response: str):
+        """Cache a response in memory, evicting the least recently used beyond the cache size."""
+        self._result_cache[request_key] = response
+        self._result_cache.move_to_end(request_key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
     def _create_chunk_prompt(self, chunk: DocumentChunk, config: Dict[str, Any]) -> str:
         """Create processing prompt for chunk."""
         output_format = config.get("structure", "general")
-        
-        prompts = {
-            "episode_segment": f"""
-Transform this content into a podcast episode segment. Make it conversational and engaging.
-Include natural transitions and speaking cues.
-
-Content:
-{chunk.content}
-""",
-            "lesson": f"""
-Transform this content into an educational lesson segment.
-Make it clear and structured with learning objectives.
-
-Content:
-{chunk.content}
-""",
-            "scene": f"""
-Transform this content into a video script scene.
-Include visual descriptions and pacing notes.
-
-Content:
-{chunk.content}
-""",
-            "general": f"""
-Process and optimize this content maintaining its key information.
-
-Content:
-{chunk.content}
-"""
-        }
-        
-        return prompts.get(output_format, prompts["general"])
+        template = _PROMPT_TEMPLATES.get(output_format, _PROMPT_TEMPLATES["general"])
+        return template.format(content=chunk.content)
     
     async def _simple_process(self, chunk: DocumentChunk, config: Dict[str, Any]) -> str:
         """Simple processing fallback."""
@@ -501,9 +742,23 @@ Content:
     
     def _estimate_tokens_used(self, chunk: DocumentChunk, response: str) -> int:
         """Estimate tokens used in processing."""
-        input_tokens = int(chunk.word_count * 1.33)
-        output_tokens = int(len(response.split()) * 1.33)
-        return input_tokens + output_tokens
+        return self._input_tokens(chunk) + self._count_tokens(response)
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text."""
+        encoding = _get_encoding()
+        if encoding is not None:
+            return len(encoding.encode_ordinary(text))
+        return int(len(text.split()) * 1.33)  # Rough estimate
+    
+    def _input_tokens(self, chunk: DocumentChunk) -> int:
+        """Get input token count for a chunk, counted once per chunk."""
+        key = id(chunk)
+        tokens = self._token_cache.get(key)
+        if tokens is None:
+            tokens = self._count_tokens(chunk.content)
+            self._token_cache[key] = tokens
+        return tokens
     
     def _calculate_actual_cost(self, model_name: str, tokens_used: int) -> float:
         """Calculate actual cost based on tokens used."""
@@ -513,36 +768,41 @@ Content:
         profile = self.model_profiles[model_name]
         return (tokens_used / 1000) * profile.cost_per_1k_tokens
     
+    def _lowered(self, chunk: DocumentChunk) -> str:
+        """Get casefolded chunk content, computed once per chunk."""
+        key = id(chunk)
+        content = self._lower_cache.get(key)
+        if content is None:
+            content = chunk.content.casefold()
+            self._lower_cache[key] = content
+        return content
+    
     def _is_complex_content(self, content: str) -> bool:
-        """Check if content requires complex reasoning."""
-        indicators = [
-            "analyze", "compare", "evaluate", "synthesize",
-            "therefore", "however", "consequently", "thus"
-        ]
-        content_lower = content.lower()
-        return sum(1 for ind in indicators if ind in content_lower) >= 2
+        """Check if casefolded content requires complex reasoning."""
+        return _has_distinct_matches(_COMPLEX_INDICATORS, content)
     
     def _is_creative_content(self, content: str) -> bool:
-        """Check if content requires creative processing."""
-        indicators = [
-            "story", "narrative", "character", "dialogue",
-            "imagine", "describe", "scene", "emotion"
-        ]
-        content_lower = content.lower()
-        return sum(1 for ind in indicators if ind in content_lower) >= 2
+        """Check if casefolded content requires creative processing."""
+        return _has_distinct_matches(_CREATIVE_INDICATORS, content)
     
     def _update_processing_stats(self, results: List[ChunkProcessingResult]):
         """Update processing statistics."""
-        self.processing_stats["total_chunks"] += len(results)
+        successful = 0
+        total_cost = 0.0
+        total_tokens = 0
         
         for result in results:
             if result.success:
-                self.processing_stats["successful_chunks"] += 1
-            else:
-                self.processing_stats["failed_chunks"] += 1
-                
-            self.processing_stats["total_cost"] += result.cost
-            self.processing_stats["total_tokens"] += result.tokens_used
+                successful += 1
+            total_cost += result.cost
+            total_tokens += result.tokens_used
+        
+        stats = self.processing_stats
+        stats["total_chunks"] += len(results)
+        stats["successful_chunks"] += successful
+        stats["failed_chunks"] += len(results) - successful
+        stats["total_cost"] += total_cost
+        stats["total_tokens"] += total_tokens
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get current processing statistics."""
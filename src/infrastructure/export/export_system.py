@@ -4,7 +4,7 @@ import json
 import csv
 from datetime import datetime
 from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import logging
 
 # Simple path setup
@@ -29,6 +29,12 @@ try:
 except ImportError:
     PYTHON_DOCX_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -45,7 +51,7 @@ class ExportResult:
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass
+@dataclass(slots=True)
 class TranslationRecord:
     """Record of a translation for export"""
     original_text: str
@@ -58,6 +64,18 @@ class TranslationRecord:
     formulas_detected: int = 0
     confidence_score: Optional[float] = None
 
+def _isoformat_timestamps(records: List[TranslationRecord]) -> List[str]:
+    """ISO-format record timestamps, formatting each distinct value once"""
+    # Batch-created records often share a timestamp
+    formatted = {}
+    timestamps = []
+    for record in records:
+        timestamp = formatted.get(record.timestamp)
+        if timestamp is None:
+            timestamp = formatted[record.timestamp] = record.timestamp.isoformat()
+        timestamps.append(timestamp)
+    return timestamps
+
 class JSONExporter:
     """Export translations to JSON format"""
     
@@ -66,26 +84,20 @@ class JSONExporter:
         """Export to JSON format"""
         try:
             records = data if isinstance(data, list) else [data]
+            now = datetime.now()
             
-            export_data = {
-                'export_info': {
-                    'timestamp': datetime.now().isoformat(),
-                    'version': '1.0',
-                    'record_count': len(records)
-                },
-                'translations': []
+            export_info = {
+                'timestamp': now.isoformat(),
+                'version': '1.0',
+                'record_count': len(records)
             }
             
-            for record in records:
-                record_dict = asdict(record)
-                if isinstance(record_dict.get('timestamp'), datetime):
-                    record_dict['timestamp'] = record.timestamp.isoformat()
-                export_data['translations'].append(record_dict)
-            
-            json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
-            json_bytes = json_str.encode('utf-8')
+            if ORJSON_AVAILABLE:
+                json_bytes = self._dumps_orjson(export_info, records)
+            else:
+                json_bytes = self._dumps_json(export_info, records)
             
-            filename = f"translations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"translations_{now.strftime('%Y%m%d_%H%M%S')}.json"
             
             return ExportResult(
                 success=True,
@@ -100,6 +112,39 @@ class JSONExporter:
                 success=False,
                 error_message=f"JSON export failed: {str(e)}"
             )
+    
+    def _dumps_orjson(self, export_info: Dict, records: List[TranslationRecord]) -> bytes:
+        """Serialize records straight to UTF-8 bytes"""
+        # orjson handles dataclasses and datetimes natively; one call for the
+        # whole list keeps the per-record loop in C. The options match the
+        # json fallback (stringified keys, 2-space indent) byte for byte
+        return orjson.dumps(
+            {'export_info': export_info, 'translations': records},
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+    
+    def _dumps_json(self, export_info: Dict, records: List[TranslationRecord]) -> bytes:
+        """Serialize with the standard library json module"""
+        export_data = {'export_info': export_info}
+        
+        # Plain attribute projection; asdict would deep-copy every field
+        export_data['translations'] = [
+            {
+                'original_text': record.original_text,
+                'translated_text': record.translated_text,
+                'source_language': record.source_language,
+                'target_language': record.target_language,
+                'timestamp': timestamp,
+                'processing_time': record.processing_time,
+                'chunk_info': record.chunk_info,
+                'formulas_detected': record.formulas_detected,
+                'confidence_score': record.confidence_score
+            }
+            for record, timestamp in zip(records, _isoformat_timestamps(records))
+        ]
+        
+        json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
+        return json_str.encode('utf-8')
 
 class CSVExporter:
     """Export translations to CSV format"""
@@ -109,34 +154,39 @@ class CSVExporter:
         """Export to CSV format"""
         try:
             records = data if isinstance(data, list) else [data]
+            now = datetime.now()
             
-            output = io.StringIO()
-            fieldnames = [
+            # Encode rows straight into the byte buffer (utf-8-sig writes the BOM)
+            output = io.BytesIO()
+            text_output = io.TextIOWrapper(
+                output, encoding='utf-8-sig', newline='', write_through=True
+            )
+            fieldnames = (
                 'timestamp', 'original_text', 'translated_text', 
                 'source_language', 'target_language', 'processing_time',
                 'formulas_detected', 'confidence_score'
-            ]
-            
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
+            )
             
-            for record in records:
-                row = {
-                    'timestamp': record.timestamp.isoformat(),
-                    'original_text': record.original_text,
-                    'translated_text': record.translated_text,
-                    'source_language': record.source_language,
-                    'target_language': record.target_language,
-                    'processing_time': record.processing_time,
-                    'formulas_detected': record.formulas_detected,
-                    'confidence_score': record.confidence_score or ""
-                }
-                writer.writerow(row)
+            writer = csv.writer(text_output)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    timestamp,
+                    record.original_text,
+                    record.translated_text,
+                    record.source_language,
+                    record.target_language,
+                    record.processing_time,
+                    record.formulas_detected,
+                    record.confidence_score or ""
+                )
+                for record, timestamp in zip(records, _isoformat_timestamps(records))
+            )
             
-            csv_content = output.getvalue()
-            csv_bytes = csv_content.encode('utf-8-sig')
+            csv_bytes = output.getvalue()
+            text_output.detach()
             
-            filename = f"translations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            filename = f"translations_{now.strftime('%Y%m%d_%H%M%S')}.csv"
             
             return ExportResult(
                 success=True,
@@ -1,7 +1,9 @@
 # src/infrastructure/formula/formula_processor.py
 import re
 import logging
-from typing import List, Dict, Optional
+from collections import deque
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 # Simple path setup
@@ -24,8 +26,17 @@ except ImportError:
         def process_mathml(self, formula):
             pass
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Preservation markers written by preserve_formulas_in_text
+_MARKER_PATTERN = re.compile(r'\[FORMULA_\d+\]')
+
 @dataclass
 class FormulaMatch:
     """Represents a detected formula"""
@@ -58,82 +69,78 @@ class STEMFormulaProcessor(FormulaProcessor):
         self.unit_patterns = [
             r'\b\d+\.?\d*\s*(mm|cm|m|km|g|kg|s|min|hr?|Hz|V|A|Ω|°C|°F|K)',
         ]
+        
+        # Each pattern is scanned on its own so that overlapping matches of
+        # different kinds are all seen and confidence decides between them
+        # (a fused alternation would let the leftmost match swallow the rest).
+        # RE2 matches in guaranteed linear time, with no backtracking blowup
+        # on adversarial input; same leftmost-first semantics as re
+        engine = re2 if RE2_AVAILABLE else re
+        self._compiled_patterns = (
+            [(engine.compile(p), 'latex', 0.9) for p in self.latex_patterns] +
+            [(engine.compile(p), 'math', 0.7) for p in self.math_patterns] +
+            [(engine.compile(f'(?i:{p})'), 'unit', 0.8) for p in self.unit_patterns]
+        )
     
     def detect_formulas(self, text: str) -> List[Dict]:
         """Detect mathematical formulas in text"""
-        formulas = []
-        
         try:
-            # Detect LaTeX formulas
-            for pattern in self.latex_patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    formulas.append({
-                        'text': match.group(0),
-                        'start_pos': match.start(),
-                        'end_pos': match.end(),
-                        'formula_type': 'latex',
-                        'confidence': 0.9
-                    })
-            
-            # Detect math expressions
-            for pattern in self.math_patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    formulas.append({
-                        'text': match.group(0),
-                        'start_pos': match.start(),
-                        'end_pos': match.end(),
-                        'formula_type': 'math',
-                        'confidence': 0.7
-                    })
+            # Detect LaTeX formulas, math expressions and units
+            matches = self._scan(text)
             
-            # Detect units
-            for pattern in self.unit_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    formulas.append({
-                        'text': match.group(0),
-                        'start_pos': match.start(),
-                        'end_pos': match.end(),
-                        'formula_type': 'unit',
-                        'confidence': 0.8
-                    })
+            # Remove overlaps (result is sorted by position)
+            kept = self._remove_overlaps(matches)
             
-            # Remove overlaps and sort
-            formulas = self._remove_overlaps(formulas)
-            formulas.sort(key=lambda x: x['start_pos'])
-            
-            return formulas
+            # Build the public dicts only for the formulas that survive
+            return [
+                {
+                    'text': text[start:end],
+                    'start_pos': start,
+                    'end_pos': end,
+                    'formula_type': formula_type,
+                    'confidence': confidence
+                }
+                for start, end, formula_type, confidence in kept
+            ]
             
         except Exception as e:
             logger.error(f"Error detecting formulas: {str(e)}")
             return []
     
-    def _remove_overlaps(self, formulas: List[Dict]) -> List[Dict]:
-        """Remove overlapping formulas"""
-        if not formulas:
-            return formulas
-        
-        formulas.sort(key=lambda x: x['start_pos'])
-        filtered = []
+    def _scan(self, text: str) -> List[Tuple[int, int, str, float]]:
+        """Collect (start, end, formula_type, confidence) for every pattern match"""
+        return [
+            (match.start(), match.end(), formula_type, confidence)
+            for pattern, formula_type, confidence in self._compiled_patterns
+            for match in pattern.finditer(text)
+        ]
+    
+    def _remove_overlaps(self, matches: List[Tuple[int, int, str, float]]) -> List[Tuple[int, int, str, float]]:
+        """Remove overlapping formulas, replacing a kept match only with a more confident one"""
+        matches.sort(key=itemgetter(0))
+        kept = []
+        # Kept matches that may still overlap a later one, in position order
+        active = deque()
         
-        for current in formulas:
-            overlaps = False
-            for existing in filtered:
-                if (current['start_pos'] < existing['end_pos'] and 
-                    current['end_pos'] > existing['start_pos']):
-                    if current['confidence'] > existing['confidence']:
-                        filtered.remove(existing)
-                        break
-                    else:
-                        overlaps = True
-                        break
+        for current in matches:
+            start, end, _, confidence = current
+            # Later matches start at or after this one, so anything ending
+            # before it can be settled
+            while active and active[0][1] <= start:
+                kept.append(active.popleft())
             
-            if not overlaps:
-                filtered.append(current)
+            # Only the first overlapping match is compared against
+            for i, existing in enumerate(active):
+                if start < existing[1] and end > existing[0]:
+                    if confidence > existing[3]:
+                        del active[i]
+                        active.append(current)
+                    break
+            else:
+                active.append(current)
         
-        return filtered
+        kept.extend(active)
+        return kept
     
     def process_latex(self, formula: str) -> str:
         """Process LaTeX formula"""
@@ -147,28 +154,32 @@ class STEMFormulaProcessor(FormulaProcessor):
         """Replace formulas with preservation markers"""
         formulas = self.detect_formulas(text)
         formula_map = {}
-        processed_text = text
+        segments = []
+        position = 0
         
-        # Process in reverse order to maintain positions
-        for i, formula in enumerate(reversed(formulas)):
-            marker = f"[FORMULA_{len(formulas)-i-1}]"
+        # Single left-to-right walk over the position-sorted formulas
+        for i, formula in enumerate(formulas):
+            marker = f"[FORMULA_{i}]"
             formula_map[marker] = formula
             
-            processed_text = (
-                processed_text[:formula['start_pos']] + 
-                marker + 
-                processed_text[formula['end_pos']:]
-            )
+            segments.append(text[position:formula['start_pos']])
+            segments.append(marker)
+            position = formula['end_pos']
         
-        return processed_text, formula_map
+        segments.append(text[position:])
+        return ''.join(segments), formula_map
     
     def restore_formulas_in_text(self, text: str, formula_map: Dict) -> str:
         """Restore preserved formulas"""
-        restored_text = text
-        for marker, formula_data in formula_map.items():
-            if marker in restored_text:
-                restored_text = restored_text.replace(marker, formula_data['text'])
-        return restored_text
+        if not formula_map:
+            return text
+        
+        # One scan over the text restores every marker
+        def restore(match):
+            formula_data = formula_map.get(match.group(0))
+            return formula_data['text'] if formula_data is not None else match.group(0)
+        
+        return _MARKER_PATTERN.sub(restore, text)
 
 class FormulaProcessorFactory:
     """Factory for creating formula processors"""
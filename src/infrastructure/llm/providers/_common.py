@@ -0,0 +1,83 @@
+"""
+Shared prompt and request plumbing for the translation providers
+"""
+import asyncio
+import functools
+import os
+import weakref
+from typing import Any, Callable
+
+from src.core.utils.rate_limiter import AsyncTokenBucket
+
+LANG_MAP = {
+    "en": "English", "vi": "Vietnamese", "zh": "Chinese",
+    "ja": "Japanese", "ko": "Korean", "es": "Spanish",
+    "fr": "French", "de": "German"
+}
+
+PROMPT_TEMPLATE = """Translate the following text from {source} to {target}.
+Only return the translated text, nothing else.
+
+Text: {text}"""
+
+@functools.lru_cache(maxsize=256)
+def prompt_prefix(source_lang: str, target_lang: str) -> str:
+    """PROMPT_TEMPLATE up to the text, formatted once per language pair"""
+    return PROMPT_TEMPLATE.format(
+        source=LANG_MAP.get(source_lang, source_lang),
+        target=LANG_MAP.get(target_lang, target_lang),
+        text=""
+    )
+
+
+class ProviderPool:
+    """
+    Process-wide request plumbing for one provider.
+
+    Holds one API client per (event loop, API key), shared by all provider
+    instances so HTTP connections are reused; httpx pools cannot outlive the
+    loop that created them. Also caps requests in flight per loop and keeps
+    a client-side request budget, so bursts wait here instead of drawing
+    429s from the API.
+
+    Args:
+        client_factory: Creates the API client for an API key
+        env_prefix: Prefix of the <PREFIX>_MAX_CONCURRENT_REQUESTS and
+            <PREFIX>_REQUESTS_PER_MINUTE overrides
+        max_concurrent_requests: Default cap on requests in flight
+        requests_per_minute: Default request budget
+    """
+
+    def __init__(self, client_factory: Callable[[str], Any], env_prefix: str,
+                 max_concurrent_requests: int, requests_per_minute: float):
+        self._client_factory = client_factory
+        self.max_concurrent_requests = int(os.getenv(
+            f"{env_prefix}_MAX_CONCURRENT_REQUESTS", max_concurrent_requests
+        ))
+        self.requests_per_minute = float(os.getenv(
+            f"{env_prefix}_REQUESTS_PER_MINUTE", requests_per_minute
+        ))
+        self.rate_limiter = AsyncTokenBucket(self.requests_per_minute, per=60.0)
+        self._clients = weakref.WeakKeyDictionary()  # loop -> {api_key: client}
+        self._request_slots = weakref.WeakKeyDictionary()  # loop -> semaphore
+
+    def client(self, api_key: str) -> Any:
+        """Client for the running event loop"""
+        loop_clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = loop_clients.get(api_key)
+        if client is None:
+            client = loop_clients[api_key] = self._client_factory(api_key)
+        return client
+
+    async def close_clients(self):
+        """Close the running event loop's pooled connections"""
+        for client in self._clients.pop(asyncio.get_running_loop(), {}).values():
+            await client.close()
+
+    def request_slot(self) -> asyncio.Semaphore:
+        """Concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        slot = self._request_slots.get(loop)
+        if slot is None:
+            slot = self._request_slots[loop] = asyncio.Semaphore(self.max_concurrent_requests)
+        return slot
@@ -1,53 +1,104 @@
 """
 Anthropic Translation Provider with Claude 4 models
 """
+import asyncio
 import os
-from anthropic import Anthropic
+import time
+from typing import Dict, List, Optional, Tuple
+import httpx
+from anthropic import AsyncAnthropic, RateLimitError
 from src.config.logging_config import get_logger
+from src.infrastructure.llm.providers._common import ProviderPool, prompt_prefix
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+SYSTEM_PROMPT = "You are a professional translator. Provide accurate and natural translations that sound native in the target language."
+
+# Claude 4 models (May 2025 release), tried in order
+MODELS = (
+    "claude-opus-4-20250514",       # Claude Opus 4 (most powerful)
+    "claude-sonnet-4-20250514",     # Claude Sonnet 4 (balanced)
+    "claude-3-5-sonnet-20241022",   # Claude 3.5 Sonnet (fallback)
+    "claude-3-haiku-20240307",      # Claude 3 Haiku (fastest/cheapest)
+)
+
+# Models the API reported as not found, per API key (model access differs between
+# keys), so they are not retried on every call. Drops expire after MODEL_DROP_TTL
+# seconds in case the 404 was transient or access has since been granted
+MODEL_DROP_TTL = float(os.getenv("ANTHROPIC_MODEL_DROP_TTL", "3600"))
+_dropped_models: Dict[str, Dict[str, float]] = {}  # api_key -> {model: expires_at}
+
+def _live_drops(api_key: str) -> Dict[str, float]:
+    """Unexpired drops for an API key"""
+    dropped = _dropped_models.setdefault(api_key, {})
+    now = time.monotonic()
+    for model in [m for m, expires_at in dropped.items() if expires_at <= now]:
+        del dropped[model]
+    return dropped
+
+def _available_models(api_key: str) -> Tuple[str, ...]:
+    """MODELS minus those currently dropped for this API key"""
+    dropped = _live_drops(api_key)
+    return tuple(m for m in MODELS if m not in dropped) if dropped else MODELS
+
+def _drop_model(api_key: str, model: str):
+    """Skip a model for this API key until the drop expires, always keeping one model"""
+    dropped = _live_drops(api_key)
+    if model in dropped or len(dropped) + 1 >= len(MODELS):
+        return
+    dropped[model] = time.monotonic() + MODEL_DROP_TTL
+
+def _create_client(api_key: str) -> AsyncAnthropic:
+    """API client; with HTTP/2, concurrent requests share one multiplexed connection"""
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(600.0, connect=5.0),  # SDK defaults
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    return AsyncAnthropic(api_key=api_key, http_client=http_client)
+
+# Shared clients, concurrency cap and request budget for this process
+_pool = ProviderPool(_create_client, "ANTHROPIC", max_concurrent_requests=8, requests_per_minute=50)
+
+async def close_shared_clients():
+    """Close the running event loop's pooled connections; call on application shutdown"""
+    await _pool.close_clients()
+
 class AnthropicProvider:
     def __init__(self):
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("Anthropic API key not found")
-        self.client = Anthropic(api_key=api_key)
+        self._api_key = api_key
+    
+    @property
+    def client(self) -> AsyncAnthropic:
+        return _pool.client(self._api_key)
         
-    async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Translate using Claude 4 models"""
-        lang_map = {
-            "en": "English", "vi": "Vietnamese", "zh": "Chinese",
-            "ja": "Japanese", "ko": "Korean", "es": "Spanish",
-            "fr": "French", "de": "German"
-        }
-        
-        prompt = f"""Translate the following text from {lang_map.get(source_lang, source_lang)} to {lang_map.get(target_lang, target_lang)}.
-Only return the translated text, nothing else.
-
-Text: {text}"""
+    async def translate(self, text: str, source_lang: str, target_lang: str,
+                        timeout: Optional[float] = None) -> str:
+        """Translate using Claude 4 models, within `timeout` seconds overall if given"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        prompt = prompt_prefix(source_lang, target_lang) + text
         
-        # Claude 4 models (May 2025 release)
-        models = [
-            "claude-opus-4-20250514",       # Claude Opus 4 (most powerful)
-            "claude-sonnet-4-20250514",     # Claude Sonnet 4 (balanced)
-            "claude-3-5-sonnet-20241022",   # Claude 3.5 Sonnet (fallback)
-            "claude-3-haiku-20240307",      # Claude 3 Haiku (fastest/cheapest)
-        ]
-        
-        for model in models:
+        for model in _available_models(self._api_key):
             try:
                 logger.info(f"Trying Anthropic model: {model}")
                 
-                response = self.client.messages.create(
-                    model=model,
-                    max_tokens=2000,
-                    temperature=0.3,
-                    system="You are a professional translator. Provide accurate and natural translations that sound native in the target language.",
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
+                if deadline is None:
+                    response = await self._create_message(model, prompt)
+                else:
+                    # Waiting for a request slot and model fallbacks share one budget
+                    response = await asyncio.wait_for(
+                        self._create_message(model, prompt),
+                        timeout=max(0.1, deadline - time.monotonic())
+                    )
                 
                 logger.info(f"Success with model: {model}")
                 return response.content[0].text.strip()
@@ -56,6 +107,36 @@ Text: {text}"""
                 logger.warning(f"Model {model} failed: {e}")
                 if "not_found_error" not in str(e):
                     raise
+                _drop_model(self._api_key, model)
                 continue
         
         raise Exception("No available Anthropic models could complete the translation")
+    
+    async def _create_message(self, model: str, prompt: str):
+        await _pool.rate_limiter.acquire()
+        async with _pool.request_slot():
+            try:
+                return await self.client.messages.create(
+                    model=model,
+                    max_tokens=2000,
+                    temperature=0.3,
+                    system=SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+            except RateLimitError:
+                # The API is still over its limit; back off harder for a while
+                _pool.rate_limiter.slow_down()
+                raise
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                              concurrency: int = 5) -> List[str]:
+        """Translate many texts with up to `concurrency` requests in flight, preserving order"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def translate_one(text: str) -> str:
+            async with semaphore:
+                return await self.translate(text, source_lang, target_lang)
+        
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
@@ -1,45 +1,164 @@
 """
 OpenAI Translation Provider
 """
+import asyncio
 import os
-from openai import OpenAI
+import re
+from typing import List
+import httpx
+from openai import AsyncOpenAI, RateLimitError
 from src.config.logging_config import get_logger
+from src.infrastructure.llm.providers._common import LANG_MAP, ProviderPool, prompt_prefix
 
 logger = get_logger(__name__)
 
+SYSTEM_PROMPT = "You are a professional translator. Provide accurate and natural translations."
+
+# Several texts in one request: numbered items separated by lines holding only %%
+PACKED_PROMPT_TEMPLATE = """Translate the following {count} numbered items from {source} to {target}.
+Return the translations in the same numbered format, separated by lines containing only %%, with no commentary.
+
+{items}"""
+
+PACKED_SYSTEM_PROMPT = "You are a professional translator. Translate each numbered item and return them in the same numbered format, no commentary."
+
+_PACKED_SEPARATOR = "\n%%\n"
+_PACKED_SPLIT = re.compile(r'\n\s*%%\s*\n')
+_ITEM_NUMBER = re.compile(r'^\s*(\d+)\.\s?')
+
+# Completion budget for a packed request; the input texts of one pack are kept
+# to a quarter of it (estimated at ~4 characters per token) so the reply fits
+PACKED_MAX_TOKENS = 4000
+PACKED_INPUT_TOKENS = PACKED_MAX_TOKENS // 4
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count, about 4 characters per token"""
+    return len(text) // 4 + 1
+
+
+def _pack_texts(texts: List[str], pack_size: int) -> List[List[str]]:
+    """Group consecutive texts into packs of at most pack_size items and PACKED_INPUT_TOKENS"""
+    packs = []
+    pack, pack_tokens = [], 0
+    for text in texts:
+        tokens = _estimate_tokens(text)
+        if pack and (len(pack) == pack_size or pack_tokens + tokens > PACKED_INPUT_TOKENS):
+            packs.append(pack)
+            pack, pack_tokens = [], 0
+        pack.append(text)
+        pack_tokens += tokens
+    if pack:
+        packs.append(pack)
+    return packs
+
+
+def _unpack_items(reply: str, count: int):
+    """Split a packed reply into its items, or None unless items 1..count come back in order"""
+    items = []
+    for number, part in enumerate(_PACKED_SPLIT.split(reply.strip()), 1):
+        match = _ITEM_NUMBER.match(part)
+        if match is None or int(match.group(1)) != number:
+            return None
+        items.append(part[match.end():].strip())
+    return items if len(items) == count else None
+
+def _create_client(api_key: str) -> AsyncOpenAI:
+    """API client that keeps warm connections around between bursts of translations"""
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(600.0, connect=5.0),  # SDK defaults
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60.0)
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+# Shared clients, concurrency cap and request budget for this process
+_pool = ProviderPool(_create_client, "OPENAI", max_concurrent_requests=16, requests_per_minute=500)
+
+async def close_shared_clients():
+    """Close the running event loop's pooled connections; call on application shutdown"""
+    await _pool.close_clients()
+
 class OpenAIProvider:
     def __init__(self):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key not found")
-        self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        return _pool.client(self._api_key)
         
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate using OpenAI GPT"""
-        lang_map = {
-            "en": "English", "vi": "Vietnamese", "zh": "Chinese",
-            "ja": "Japanese", "ko": "Korean", "es": "Spanish",
-            "fr": "French", "de": "German"
-        }
-        
-        prompt = f"""Translate the following text from {lang_map.get(source_lang, source_lang)} to {lang_map.get(target_lang, target_lang)}.
-Only return the translated text, nothing else.
-
-Text: {text}"""
+        prompt = prompt_prefix(source_lang, target_lang) + text
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional translator. Provide accurate and natural translations."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=2000
-            )
-            
+            response = await self._create_completion(SYSTEM_PROMPT, prompt, max_tokens=2000)
             return response.choices[0].message.content.strip()
             
         except Exception as e:
             logger.error(f"OpenAI translation failed: {e}")
             raise
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                              concurrency: int = 5, pack_size: int = 1) -> List[str]:
+        """
+        Translate many texts with up to `concurrency` requests in flight, preserving order.
+        With pack_size > 1, up to that many texts (and PACKED_INPUT_TOKENS) share one request.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        if pack_size > 1:
+            async def translate_group(group: List[str]) -> List[str]:
+                async with semaphore:
+                    return await self._translate_packed(group, source_lang, target_lang)
+            
+            groups = _pack_texts(texts, pack_size)
+            results = await asyncio.gather(*(translate_group(group) for group in groups))
+            return [translation for group in results for translation in group]
+        
+        async def translate_one(text: str) -> str:
+            async with semaphore:
+                return await self.translate(text, source_lang, target_lang)
+        
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
+    
+    async def _translate_packed(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate texts in one numbered request, falling back to one request each"""
+        if len(texts) == 1:
+            return [await self.translate(texts[0], source_lang, target_lang)]
+        
+        prompt = PACKED_PROMPT_TEMPLATE.format(
+            count=len(texts),
+            source=LANG_MAP.get(source_lang, source_lang),
+            target=LANG_MAP.get(target_lang, target_lang),
+            items=_PACKED_SEPARATOR.join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+        )
+        
+        response = await self._create_completion(PACKED_SYSTEM_PROMPT, prompt, max_tokens=PACKED_MAX_TOKENS)
+        items = _unpack_items(response.choices[0].message.content, len(texts))
+        if items is not None:
+            return items
+        
+        # The reply does not line up with the input, so translate items separately
+        logger.warning(f"Packed translation did not return items 1-{len(texts)} in order, retrying individually")
+        return list(await asyncio.gather(*(self.translate(text, source_lang, target_lang) for text in texts)))
+    
+    async def _create_completion(self, system_prompt: str, prompt: str, max_tokens: int):
+        await _pool.rate_limiter.acquire()
+        async with _pool.request_slot():
+            try:
+                return await self.client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=max_tokens
+                )
+            except RateLimitError:
+                # The API is still over its limit; back off harder for a while
+                _pool.rate_limiter.slow_down()
+                raise
@@ -1,7 +1,9 @@
 # src/infrastructure/ocr/ocr_engine.py
+import functools
 import io
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import logging
 
 # Simple path setup
@@ -53,11 +55,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Image modes passed to Tesseract without conversion
+_TESSERACT_MODES = ('RGB', 'L')
+
+# Languages reported when Tesseract cannot be queried
+_FALLBACK_LANGS = ('eng', 'vie', 'fra', 'deu', 'spa')
+_FALLBACK_LANG_SET = frozenset(_FALLBACK_LANGS)
+
+@functools.lru_cache(maxsize=1)
+def _supported_langs() -> Tuple[tuple, frozenset]:
+    """Installed Tesseract languages, in order and as a set (spawns tesseract, so cached)"""
+    langs = tuple(pytesseract.get_languages(config=''))
+    return langs, frozenset(langs)
+
 class TesseractOCREngine(OCREngine):
     """Simple Tesseract OCR engine"""
     
-    def __init__(self, language: str = "eng"):
+    def __init__(self, language: str = "eng", max_dimension: Optional[int] = None):
         self.default_language = language
+        self.max_dimension = max_dimension  # Downscale larger images before OCR
         self.confidence_threshold = 0.0
         self.available = TESSERACT_AVAILABLE
     
@@ -81,9 +97,12 @@ class TesseractOCREngine(OCREngine):
             # Open image
             image = Image.open(io.BytesIO(image_data))
             
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Tesseract reads RGB and greyscale directly; greyscale is cheaper for the rest
+            if image.mode not in _TESSERACT_MODES:
+                image = image.convert('L')
+            
+            if self.max_dimension and max(image.size) > self.max_dimension:
+                image.thumbnail((self.max_dimension, self.max_dimension))
             
             # Extract text
             text = pytesseract.image_to_string(image, lang=language)
@@ -107,16 +126,33 @@ class TesseractOCREngine(OCREngine):
                 language=language or self.default_language
             )
     
+    def extract_text_batch(self, images: List[bytes], language: str = None,
+                           max_workers: Optional[int] = None) -> List[OCRResult]:
+        """Extract text from many images, running Tesseract processes concurrently"""
+        if len(images) <= 1 or not self.available:
+            return [self.extract_text(image_data, language) for image_data in images]
+        
+        # Each call waits on a tesseract subprocess, so threads overlap the work
+        workers = min(len(images), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda image_data: self.extract_text(image_data, language), images))
+    
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages"""
+        return list(self._languages()[0])
+    
+    def supports_language(self, language: str) -> bool:
+        """Check a language code without copying the language list"""
+        return language in self._languages()[1]
+    
+    def _languages(self) -> Tuple[tuple, frozenset]:
         if self.available:
             try:
-                langs = pytesseract.get_languages(config='')
-                return langs
+                return _supported_langs()
             except:
                 pass
         
-        return ['eng', 'vie', 'fra', 'deu', 'spa']
+        return _FALLBACK_LANGS, _FALLBACK_LANG_SET
     
     def set_confidence_threshold(self, threshold: float) -> None:
         """Set minimum confidence threshold"""
@@ -1,7 +1,10 @@
 # src/infrastructure/processors/pdf_processor.py
 import io
+import mmap
+import os
 import time
-from typing import Union, BinaryIO, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, BinaryIO, List, Optional, Tuple
 import logging
 
 try:
@@ -22,13 +25,61 @@ from src.core.interfaces.document_processing import DocumentProcessor, Processin
 
 logger = logging.getLogger(__name__)
 
+# Pages per worker process below which pdfplumber extraction stays in-process
+PARALLEL_MIN_PAGES = 16
+
+def _table_to_text(table: List[List]) -> str:
+    """Convert table data to readable text"""
+    if not table:
+        return ""
+    
+    return "\n".join(
+        " | ".join("" if cell is None else str(cell) for cell in row)
+        for row in table if row
+    )
+
+def _as_stream(pdf_data) -> BinaryIO:
+    """File-like view of PDF data for the extraction libraries"""
+    if isinstance(pdf_data, mmap.mmap):
+        # mmap is already seekable and readable; avoid copying it into BytesIO
+        pdf_data.seek(0)
+        return pdf_data
+    # BytesIO shares the buffer of a bytes object until it is written to
+    return io.BytesIO(pdf_data)
+
+def _extract_pdfplumber_pages(pages) -> Tuple[List[str], bool]:
+    """Extract text and tables from pdfplumber pages"""
+    text_parts = []
+    has_tables = False
+    
+    for page in pages:
+        # Extract text
+        page_text = page.extract_text()
+        if page_text:
+            text_parts.append(page_text)
+        
+        # Check for tables
+        tables = page.extract_tables()
+        if tables:
+            has_tables = True
+            for table in tables:
+                text_parts.append(_table_to_text(table))
+    
+    return text_parts, has_tables
+
+def _extract_pdfplumber_range(pdf_bytes: bytes, start: int, stop: int) -> Tuple[List[str], bool]:
+    """Extract pages [start, stop) in a worker process"""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return _extract_pdfplumber_pages(pdf.pages[start:stop])
+
 class PDFProcessor(DocumentProcessor):
     """PDF processor with multiple extraction methods"""
     
-    def __init__(self, method: str = "auto"):
+    def __init__(self, method: str = "auto", max_workers: Optional[int] = None):
         """Initialize PDF processor"""
         self.method = method
         self.supported_formats = ['.pdf']
+        self.max_workers = max_workers or os.cpu_count() or 1
         
         # Check available methods
         if method == "pypdf2" and not PYPDF2_AVAILABLE:
@@ -36,13 +87,18 @@ class PDFProcessor(DocumentProcessor):
         elif method == "pdfplumber" and not PDFPLUMBER_AVAILABLE:
             logger.warning("pdfplumber not available, falling back to PyPDF2")
     
-    def process(self, file_content: Union[bytes, BinaryIO], filename: str) -> ProcessingResult:
-        """Process PDF file and extract text"""
+    def process(self, file_content: Union[bytes, memoryview, BinaryIO, str],
+                filename: str) -> ProcessingResult:
+        """Process PDF file (bytes, stream or path) and extract text"""
         start_time = time.time()
+        mapped = None
         
         try:
-            # Convert to bytes if needed
-            if hasattr(file_content, 'read'):
+            # Map files from disk instead of reading them into memory
+            mapped = self._map_file(file_content)
+            if mapped is not None:
+                pdf_bytes = mapped
+            elif hasattr(file_content, 'read'):
                 pdf_bytes = file_content.read()
             else:
                 pdf_bytes = file_content
@@ -56,6 +112,11 @@ class PDFProcessor(DocumentProcessor):
                     error_message="Invalid PDF file"
                 )
             
+            # The whole document is addressable here, so the trailer check is a cheap tail slice
+            # (copied to bytes: substring tests on a memoryview compare single bytes as ints)
+            if b'%%EOF' not in bytes(pdf_bytes[-1024:]):
+                logger.warning(f"PDF {filename} has no %%EOF marker, file may be truncated")
+            
             # Try different extraction methods
             result = self._extract_text_auto(pdf_bytes)
             
@@ -85,6 +146,24 @@ class PDFProcessor(DocumentProcessor):
                 error_message=f"PDF processing failed: {str(e)}",
                 processing_time=time.time() - start_time
             )
+        finally:
+            if mapped is not None:
+                mapped.close()
+    
+    def _map_file(self, file_content) -> Optional[mmap.mmap]:
+        """Memory-map a path or real file object; None when it cannot be mapped"""
+        try:
+            if isinstance(file_content, str):
+                with open(file_content, 'rb') as f:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # A stream positioned past the start is read from there instead
+            if hasattr(file_content, 'fileno') and file_content.tell() == 0:
+                return mmap.mmap(file_content.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            # In-memory streams have no file descriptor; empty files cannot be mapped
+            if isinstance(file_content, str):
+                raise
+        return None
     
     def _extract_text_auto(self, pdf_bytes: bytes) -> dict:
         """Auto-select best extraction method"""
@@ -112,26 +191,27 @@ class PDFProcessor(DocumentProcessor):
     
     def _extract_with_pdfplumber(self, pdf_bytes: bytes) -> dict:
         """Extract text using pdfplumber"""
-        text_parts = []
-        page_count = 0
-        has_tables = False
-        
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        with pdfplumber.open(_as_stream(pdf_bytes)) as pdf:
             page_count = len(pdf.pages)
+            workers = min(self.max_workers, page_count // PARALLEL_MIN_PAGES)
+            
+            if workers <= 1:
+                text_parts, has_tables = _extract_pdfplumber_pages(pdf.pages)
+        
+        if workers > 1:
+            # Layout parsing is CPU-bound; split contiguous page ranges across processes
+            step = -(-page_count // workers)
+            if not isinstance(pdf_bytes, bytes):
+                pdf_bytes = bytes(pdf_bytes)  # Workers need a picklable copy
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_extract_pdfplumber_range, pdf_bytes, start, start + step)
+                    for start in range(0, page_count, step)
+                ]
+                results = [future.result() for future in futures]
             
-            for page in pdf.pages:
-                # Extract text
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-                
-                # Check for tables
-                tables = page.extract_tables()
-                if tables:
-                    has_tables = True
-                    for table in tables:
-                        table_text = self._process_table(table)
-                        text_parts.append(table_text)
+            text_parts = [part for parts, _ in results for part in parts]
+            has_tables = any(tables for _, tables in results)
         
         return {
             'text': '\n\n'.join(text_parts),
@@ -144,7 +224,7 @@ class PDFProcessor(DocumentProcessor):
         """Extract text using PyPDF2"""
         text_parts = []
         
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        pdf_reader = PyPDF2.PdfReader(_as_stream(pdf_bytes))
         page_count = len(pdf_reader.pages)
         
         for page in pdf_reader.pages:
@@ -171,37 +251,27 @@ class PDFProcessor(DocumentProcessor):
     
     def _process_table(self, table: List[List]) -> str:
         """Convert table data to readable text"""
-        if not table:
-            return ""
-        
-        processed_rows = []
-        for row in table:
-            if row:
-                processed_row = [str(cell) if cell is not None else "" for cell in row]
-                processed_rows.append(" | ".join(processed_row))
-        
-        return "\n".join(processed_rows)
+        return _table_to_text(table)
     
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file formats"""
         return self.supported_formats
     
-    def validate_file(self, file_content: Union[bytes, BinaryIO], filename: str) -> bool:
+    def validate_file(self, file_content: Union[bytes, memoryview, BinaryIO], filename: str) -> bool:
         """Validate if file is a valid PDF"""
         try:
             # Check file extension
             if not filename.lower().endswith('.pdf'):
                 return False
             
-            # Convert to bytes if needed
+            # Peek at the header only; slicing bytes, memoryview or mmap does not copy the rest
             if hasattr(file_content, 'read'):
-                pdf_bytes = file_content.read()
+                head = file_content.read(8)
                 file_content.seek(0)  # Reset position
             else:
-                pdf_bytes = file_content
+                head = bytes(file_content[:8])
             
-            # Check PDF header
-            if not pdf_bytes.startswith(b'%PDF'):
+            if not head.startswith(b'%PDF-'):
                 return False
             
             return True
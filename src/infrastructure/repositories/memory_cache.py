@@ -2,21 +2,48 @@
 
 import hashlib
 import time
-from typing import Dict, Optional, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, Optional, Any, Set
 
 from src.core.interfaces.translation import CacheInterface
 from src.core.entities.translation import TranslationResult
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+
+def _new_key_hasher():
+    """Fast non-cryptographic hasher for cache keys."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Cached result with its expiry time (monotonic seconds)."""
+    result: TranslationResult
+    expires_at: float
+    size: int  # Characters of text and metadata counted towards memory usage
+
 
 class MemoryCache(CacheInterface):
     """In-memory cache implementation for translations."""
     
     def __init__(self, default_ttl: int = 3600):
         self.default_ttl = default_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, datetime] = {}
+        # Ordered least to most recently used
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
         self._max_size = 1000  # Maximum cache entries
+        self._total_size = 0  # Sum of entry sizes, kept up to date on set/remove
+        self._next_expiry = float('inf')  # No entry expires before this (monotonic seconds)
+        # Structured keys ("user123:vi:...") indexed by each ':'-terminated prefix
+        self._prefix_index: Dict[str, Set[str]] = defaultdict(set)
     
     async def get(self, key: str) -> Optional[TranslationResult]:
         """Get cached translation result."""
@@ -30,48 +57,46 @@ class MemoryCache(CacheInterface):
             await self._remove(key)
             return None
         
-        # Update access time
-        self._access_times[key] = datetime.now()
+        # Mark as most recently used
+        self._cache.move_to_end(key)
         
-        # Reconstruct TranslationResult from cached data
-        return TranslationResult(**entry['data'])
+        # Callers get their own copy; mutating it must not change the cache
+        return self._copy_result(entry.result)
     
     async def set(self, key: str, result: TranslationResult, ttl: int = None) -> None:
         """Cache translation result."""
         if ttl is None:
             ttl = self.default_ttl
         
-        # Clean up if cache is too large
-        if len(self._cache) >= self._max_size:
-            await self._cleanup_old_entries()
-        
-        # Store result
-        self._cache[key] = {
-            'data': {
-                'translated_text': result.translated_text,
-                'source_language': result.source_language,
-                'target_language': result.target_language,
-                'confidence': result.confidence,
-                'processing_time': result.processing_time,
-                'chunks_processed': result.chunks_processed,
-                'tokens_used': result.tokens_used,
-                'model_used': result.model_used,
-                'metadata': result.metadata,
-                'created_at': result.created_at
-            },
-            'expires_at': datetime.now() + timedelta(seconds=ttl),
-            'created_at': datetime.now()
-        }
-        
-        self._access_times[key] = datetime.now()
+        previous = self._cache.get(key)
+        if previous is not None:
+            self._total_size -= previous.size
+        else:
+            if len(self._cache) >= self._max_size:
+                await self._make_room()
+            self._index_key(key)
+        
+        size = len(str(result.translated_text)) + len(str(result.metadata))
+        expires_at = time.monotonic() + ttl
+        self._cache[key] = _Entry(self._copy_result(result), expires_at, size)
+        self._cache.move_to_end(key)
+        self._total_size += size
+        self._next_expiry = min(self._next_expiry, expires_at)
     
     async def invalidate(self, pattern: str) -> None:
         """Invalidate cache entries matching pattern."""
-        keys_to_remove = []
+        keys_to_remove = [key for key in self._cache if pattern in key]
         
-        for key in self._cache.keys():
-            if pattern in key:
-                keys_to_remove.append(key)
+        for key in keys_to_remove:
+            await self._remove(key)
+    
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Invalidate cache entries whose key starts with prefix."""
+        if prefix in self._prefix_index:
+            # Structured prefix such as "user123:" - only touch matching keys
+            keys_to_remove = list(self._prefix_index[prefix])
+        else:
+            keys_to_remove = [key for key in self._cache if key.startswith(prefix)]
         
         for key in keys_to_remove:
             await self._remove(key)
@@ -79,7 +104,9 @@ class MemoryCache(CacheInterface):
     async def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
-        self._access_times.clear()
+        self._total_size = 0
+        self._prefix_index.clear()
+        self._next_expiry = float('inf')
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -95,53 +122,66 @@ class MemoryCache(CacheInterface):
             'memory_usage_mb': self._estimate_memory_usage()
         }
     
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def _is_expired(self, entry: _Entry) -> bool:
         """Check if cache entry is expired."""
-        return datetime.now() > entry['expires_at']
+        return time.monotonic() > entry.expires_at
+    
+    @staticmethod
+    def _copy_result(result: TranslationResult) -> TranslationResult:
+        """Shallow copy of a result, with its own metadata dict."""
+        return replace(result, metadata=dict(result.metadata or {}))
+    
+    async def _make_room(self) -> None:
+        """Remove expired entries, or the least recently used one if none have expired."""
+        now = time.monotonic()
+        if now > self._next_expiry:
+            # Something may have expired; the scan also recomputes the bound
+            expired_keys = [key for key, entry in self._cache.items() if now > entry.expires_at]
+            for key in expired_keys:
+                await self._remove(key)
+            self._next_expiry = min(
+                (entry.expires_at for entry in self._cache.values()), default=float('inf')
+            )
+            if expired_keys:
+                return
+        
+        evicted_key, evicted = self._cache.popitem(last=False)
+        self._total_size -= evicted.size
+        self._unindex_key(evicted_key)
     
     async def _remove(self, key: str) -> None:
         """Remove entry from cache."""
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._access_times:
-            del self._access_times[key]
-    
-    async def _cleanup_old_entries(self) -> None:
-        """Remove old or expired entries."""
-        current_time = datetime.now()
-        
-        # Remove expired entries first
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if self._is_expired(entry)
-        ]
-        
-        for key in expired_keys:
-            await self._remove(key)
-        
-        # If still too large, remove least recently accessed
-        if len(self._cache) >= self._max_size:
-            # Sort by access time, remove oldest
-            sorted_keys = sorted(
-                self._access_times.keys(),
-                key=lambda k: self._access_times[k]
-            )
-            
-            # Remove oldest 20% of entries
-            num_to_remove = max(1, len(sorted_keys) // 5)
-            for key in sorted_keys[:num_to_remove]:
-                await self._remove(key)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry.size
+            self._unindex_key(key)
+    
+    @staticmethod
+    def _key_prefixes(key: str) -> Iterator[str]:
+        """Yield each ':'-terminated prefix of a key."""
+        end = key.find(':')
+        while end != -1:
+            yield key[:end + 1]
+            end = key.find(':', end + 1)
+    
+    def _index_key(self, key: str) -> None:
+        """Add key to the prefix index."""
+        for prefix in self._key_prefixes(key):
+            self._prefix_index[prefix].add(key)
+    
+    def _unindex_key(self, key: str) -> None:
+        """Remove key from the prefix index."""
+        for prefix in self._key_prefixes(key):
+            keys = self._prefix_index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._prefix_index[prefix]
     
     def _estimate_memory_usage(self) -> float:
         """Estimate memory usage in MB."""
-        total_chars = 0
-        for entry in self._cache.values():
-            data = entry['data']
-            total_chars += len(str(data.get('translated_text', '')))
-            total_chars += len(str(data.get('metadata', {})))
-        
         # Rough estimate: 1 char ≈ 1 byte, plus overhead
-        return (total_chars * 2) / (1024 * 1024)  # Convert to MB
+        return (self._total_size * 2) / (1024 * 1024)  # Convert to MB
 
 
 class SmartCache(MemoryCache):
@@ -167,16 +207,18 @@ class SmartCache(MemoryCache):
     
     def generate_key(self, text: str, target_lang: str, **kwargs) -> str:
         """Generate optimized cache key."""
-        # Include important parameters that affect translation
-        key_parts = [
-            text,
+        # Include important parameters that affect translation; hashed piecewise
+        # so the (possibly large) text is not copied into a joined string
+        hasher = _new_key_hasher()
+        hasher.update(text.encode())
+        for part in (
             target_lang,
             str(kwargs.get('preserve_formatting', True)),
             str(kwargs.get('quality_tier', 'standard'))
-        ]
-        
-        content = ":".join(key_parts)
-        return hashlib.sha256(content.encode()).hexdigest()
+        ):
+            hasher.update(b':')
+            hasher.update(part.encode())
+        return hasher.hexdigest()
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get detailed performance statistics."""
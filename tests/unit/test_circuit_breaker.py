@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from src.core.models.document import DocumentChunk
+from src.core.utils import circuit_breaker
+from src.core.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.infrastructure.document_processing.orchestrators.model_orchestrator import ModelOrchestrator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the breaker module."""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def open_breaker(clock, threshold=2, timeout=10.0):
+    breaker = CircuitBreaker(failure_threshold=threshold, recovery_timeout=timeout)
+    for _ in range(threshold):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    return breaker
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_single_probe_after_recovery_timeout(self, clock):
+        breaker = open_breaker(clock)
+        clock[0] += 10.0
+        assert breaker.allow_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.allow_request()
+
+    def test_probe_outcome_decides_state(self, clock):
+        breaker = open_breaker(clock)
+        clock[0] += 10.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+        clock[0] += 10.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_release_probe_allows_another_probe(self, clock):
+        breaker = open_breaker(clock)
+        clock[0] += 10.0
+        assert breaker.allow_request()
+        breaker.release_probe()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+
+class ProviderError(Exception):
+    """Stands in for an SDK error raised from inside a provider package."""
+
+
+ProviderError.__module__ = "openai"
+
+
+class FakeLLM:
+    def __init__(self, error=None, delay=0.0):
+        self.error = error
+        self.delay = delay
+
+    async def translate(self, prompt, **kwargs):
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return "ok"
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setenv("PROVIDER_FAILURE_THRESHOLD", "1")
+    return ModelOrchestrator()
+
+
+def process(orchestrator, llm, index=0):
+    chunk = DocumentChunk(content=f"chunk {index}", start_position=index, end_position=index + 1)
+    return orchestrator._process_single_chunk(chunk, "gpt-3.5-turbo", {}, llm=llm)
+
+
+class TestOrchestratorBreaker:
+    def test_provider_error_opens_breaker(self, orchestrator):
+        result = asyncio.run(process(orchestrator, FakeLLM(ProviderError("rate limited"))))
+        assert result.error
+        assert orchestrator._get_breaker("openai").state is CircuitState.OPEN
+
+    def test_timeout_opens_breaker(self, orchestrator):
+        asyncio.run(process(orchestrator, FakeLLM(asyncio.TimeoutError())))
+        assert orchestrator._get_breaker("openai").state is CircuitState.OPEN
+
+    def test_programming_error_does_not_open_breaker(self, orchestrator):
+        result = asyncio.run(process(orchestrator, FakeLLM(TypeError("unexpected keyword"))))
+        assert result.error
+        breaker = orchestrator._get_breaker("openai")
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_cancelled_probe_is_released(self, orchestrator, clock):
+        breaker = orchestrator._get_breaker("openai")
+        breaker.record_failure()
+        clock[0] += breaker.recovery_timeout
+
+        async def main():
+            task = asyncio.create_task(process(orchestrator, FakeLLM(delay=10)))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    def test_failed_non_provider_probe_is_released(self, orchestrator, clock):
+        breaker = orchestrator._get_breaker("openai")
+        breaker.record_failure()
+        clock[0] += breaker.recovery_timeout
+
+        asyncio.run(process(orchestrator, FakeLLM(ValueError("bad prompt"))))
+        assert breaker.allow_request()
+
+    def test_successful_probe_closes_breaker(self, orchestrator, clock):
+        breaker = orchestrator._get_breaker("openai")
+        breaker.record_failure()
+        clock[0] += breaker.recovery_timeout
+
+        result = asyncio.run(process(orchestrator, FakeLLM()))
+        assert result.processed_content == "ok"
+        assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from src.core.models.document import DocumentChunk
+from src.infrastructure.document_processing.orchestrators import cost_calculator
+from src.infrastructure.document_processing.orchestrators.cost_calculator import CostCalculator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock for usage timestamps."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cost_calculator.time, "time", lambda: now[0])
+    return now
+
+
+def make_calculator(monkeypatch, history_max):
+    monkeypatch.setattr(cost_calculator, "COST_HISTORY_MAX", history_max)
+    return CostCalculator()
+
+
+def track(calculator, count, model="gpt-3.5-turbo", start=0):
+    for i in range(start, start + count):
+        calculator.track_usage(model, 100, 50, 0.01, f"doc-{i}", chunk_id=f"chunk-{i}")
+
+
+class TestUsageStore:
+    def test_history_keeps_newest_rows_in_order(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 10)
+        track(calculator, 25)
+
+        history = calculator.usage_history
+        assert [record["chunk_id"] for record in history] == [f"chunk-{i}" for i in range(15, 25)]
+        assert [record["document_id"] for record in history] == [f"doc-{i}" for i in range(15, 25)]
+
+    def test_ring_buffer_drops_one_row_per_overflow(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 4)
+        track(calculator, 4)
+        track(calculator, 1, start=4)
+
+        assert [record["chunk_id"] for record in calculator.usage_history] == [
+            "chunk-1", "chunk-2", "chunk-3", "chunk-4"
+        ]
+
+    def test_grows_until_cap(self, monkeypatch, clock):
+        monkeypatch.setattr(cost_calculator, "USAGE_INITIAL_CAPACITY", 2)
+        calculator = make_calculator(monkeypatch, 5)
+        track(calculator, 7)
+
+        assert len(calculator._usage["ts"]) == 5
+        assert len(calculator.usage_history) == 5
+
+    def test_intern_tables_stay_bounded(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 10)
+        track(calculator, 1000)
+
+        assert len(calculator._usage_docs) <= 2 * 10
+        assert calculator.usage_history[-1]["document_id"] == "doc-999"
+
+    def test_summary_matches_retained_rows(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 10)
+        track(calculator, 60, model="gpt-4o")
+        clock[0] += 3600
+        track(calculator, 40, start=60)
+
+        bucketed = calculator.get_usage_summary(24)
+        raw = calculator._summarize_usage_history(clock[0] - 24 * 3600)
+        assert bucketed == raw
+        assert bucketed["usage_count"] == 10
+        assert bucketed["document_count"] == 10
+        assert bucketed["model_breakdown"] == {
+            "gpt-3.5-turbo": {"count": 10, "cost": pytest.approx(0.1), "tokens": 1500}
+        }
+
+    def test_summary_window_starts_at_exact_cutoff(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 100)
+        hour = 472_222 * 3600
+        # The cutoff falls half way through the first hour
+        for offset, cost in ((360, 1.0), (2700, 2.0), (5400, 4.0)):
+            clock[0] = hour + offset
+            calculator.track_usage("gpt-4o", 100, 50, cost, f"doc-{offset}")
+        clock[0] = hour + 1800 + 24 * 3600
+
+        bucketed = calculator.get_usage_summary(24)
+        raw = calculator._summarize_usage_history(clock[0] - 24 * 3600)
+        assert bucketed == raw
+        assert bucketed["total_cost"] == 6.0
+        assert bucketed["usage_count"] == 2
+        assert bucketed["document_count"] == 2
+
+    def test_summary_window_over_wrapped_ring(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 4)
+        for i in range(6):
+            clock[0] += 1000
+            calculator.track_usage("gpt-4o", 100, 50, float(i), f"doc-{i}")
+
+        # Rows 2..5 are retained; rows 3..5 are at most 2500 s old
+        summary = calculator._summarize_usage_history(clock[0] - 2500)
+        assert summary["total_cost"] == 12.0
+        assert calculator.get_usage_summary(1) == calculator._summarize_usage_history(clock[0] - 3600)
+
+    def test_cap_of_one(self, monkeypatch, clock):
+        calculator = make_calculator(monkeypatch, 1)
+        track(calculator, 3)
+
+        assert [record["chunk_id"] for record in calculator.usage_history] == ["chunk-2"]
+        assert calculator.get_usage_summary(24)["usage_count"] == 1
+
+    @pytest.mark.parametrize("history_max", [0, -1])
+    def test_cap_must_be_positive(self, monkeypatch, history_max):
+        with pytest.raises(ValueError):
+            make_calculator(monkeypatch, history_max)
+
+
+class TestChunkCosts:
+    def test_batch_matches_single_chunk_costs(self):
+        calculator = CostCalculator()
+        chunks = [
+            DocumentChunk(
+                content=" ".join(["word"] * words),
+                start_position=0,
+                end_position=words,
+                metadata={"type": chunk_type}
+            )
+            for words, chunk_type in ((0, "general"), (1, "scene"), (250, "summary"), (1000, "other"))
+        ]
+
+        batch = calculator.calculate_chunk_costs_batch(chunks, "gpt-4o")
+        single = [calculator.calculate_chunk_cost(chunk, "gpt-4o") for chunk in chunks]
+        np.testing.assert_allclose(batch, single)
+
+
+class TestCythonExtension:
+    @pytest.fixture
+    def ext(self):
+        return pytest.importorskip(
+            "src.infrastructure.document_processing.orchestrators.cost_calculator_ext"
+        )
+
+    def test_chunk_cost_kernel(self, ext):
+        ratios = np.array([0.5, 2.0])
+        costs = ext.chunk_cost_kernel(
+            np.array([0, 100, 1000], dtype=np.int64),
+            np.array([0, 1, 0], dtype=np.int64),
+            0.001, 0.002, ratios
+        )
+        expected = []
+        for words, type_id in ((0, 0), (100, 1), (1000, 0)):
+            tokens = (words * 1362) >> 10
+            expected.append(tokens * 0.001 + np.floor(tokens * ratios[type_id]) * 0.002)
+        np.testing.assert_allclose(list(costs), expected)
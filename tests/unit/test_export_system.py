@@ -0,0 +1,50 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.export import export_system
+from src.infrastructure.export.export_system import JSONExporter, TranslationRecord
+
+
+@pytest.fixture
+def records():
+    return [
+        TranslationRecord(
+            original_text=f"héllo {i}",
+            translated_text='xin chào, "q"\n',
+            source_language="en",
+            target_language="vi",
+            timestamp=datetime(2024, 1, 2, 3, 4, 5, 6000 * i),
+            processing_time=0.5 * i,
+            chunk_info={1: 2, "pages": [i, i + 1], "nested": {}} if i % 2 else None,
+            formulas_detected=i,
+            confidence_score=0.9 if i % 3 else None
+        )
+        for i in range(4)
+    ]
+
+
+class TestJSONExport:
+    def test_orjson_output_matches_json_fallback(self, records):
+        pytest.importorskip("orjson")
+        exporter = JSONExporter()
+        export_info = {"timestamp": "2024-01-02T00:00:00", "version": "1.0", "record_count": 4}
+
+        fast = exporter._dumps_orjson(export_info, records)
+        fallback = exporter._dumps_json(export_info, records)
+        assert fast == fallback
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_handles_non_str_keys(self, records, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(export_system, "ORJSON_AVAILABLE", use_orjson)
+
+        result = JSONExporter().export(records)
+        assert result.success, result.error_message
+        data = json.loads(result.file_data)
+        assert data["export_info"]["record_count"] == 4
+        assert data["translations"][1]["chunk_info"] == {"1": 2, "pages": [1, 2], "nested": {}}
+        assert data["translations"][1]["timestamp"] == "2024-01-02T03:04:05.006000"
+        assert result.file_data.startswith(b'{\n  "export_info": {\n')
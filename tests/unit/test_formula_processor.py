@@ -0,0 +1,54 @@
+import pytest
+
+from src.infrastructure.formula import formula_processor
+from src.infrastructure.formula.formula_processor import STEMFormulaProcessor
+
+
+@pytest.fixture(params=[True, False], ids=["re2", "re"])
+def processor(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("re2")
+    monkeypatch.setattr(formula_processor, "RE2_AVAILABLE", request.param)
+    return STEMFormulaProcessor()
+
+
+def detected(processor, text):
+    return [
+        (f['text'], f['start_pos'], f['end_pos'], f['formula_type'], f['confidence'])
+        for f in processor.detect_formulas(text)
+    ]
+
+
+class TestOverlaps:
+    def test_more_confident_unit_wins_over_math(self, processor):
+        assert detected(processor, "x = 5kg") == [("5kg", 4, 7, "unit", 0.8)]
+
+    def test_latex_wins_over_contained_math(self, processor):
+        assert detected(processor, "$E = mc^2$") == [("$E = mc^2$", 0, 10, "latex", 0.9)]
+
+    def test_first_overlap_is_kept_on_equal_confidence(self, processor):
+        assert detected(processor, "y = 2 + 3") == [("y = 2 + 3", 0, 9, "math", 0.7)]
+
+    def test_unit_inside_math_expression(self, processor):
+        assert detected(processor, "Speed v = 12 m/s, 7 / 8") == [
+            ("12 m", 10, 14, "unit", 0.8),
+            ("7 / 8", 18, 23, "math", 0.7),
+        ]
+
+    def test_separate_formulas_are_all_kept(self, processor):
+        assert detected(processor, r"$a$ and \sqrt{2} then ∑") == [
+            ("$a$", 0, 3, "latex", 0.9),
+            (r"\sqrt{2}", 8, 16, "latex", 0.9),
+            ("∑", 22, 23, "math", 0.7),
+        ]
+
+    def test_no_formulas(self, processor):
+        assert detected(processor, "No formulas here at all.") == []
+
+
+class TestPreservation:
+    def test_round_trip(self, processor):
+        text = "Mass x = 5kg and $E = mc^2$ at 20°C."
+        preserved, formula_map = processor.preserve_formulas_in_text(text)
+        assert preserved == "Mass x = [FORMULA_0] and [FORMULA_1] at [FORMULA_2]."
+        assert processor.restore_formulas_in_text(preserved, formula_map) == text
@@ -0,0 +1,150 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+pytest.importorskip("anthropic")
+
+from src.infrastructure.llm.providers import anthropic_provider, openai_provider
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
+
+
+@pytest.mark.parametrize("module, provider_class", [
+    (openai_provider, "OpenAIProvider"),
+    (anthropic_provider, "AnthropicProvider"),
+])
+class TestSharedClients:
+    def test_client_shared_within_loop(self, module, provider_class):
+        async def clients():
+            first = getattr(module, provider_class)()
+            second = getattr(module, provider_class)()
+            return first.client, second.client
+
+        first, second = asyncio.run(clients())
+        assert first is second
+
+    def test_client_not_reused_across_loops(self, module, provider_class):
+        provider = getattr(module, provider_class)()
+
+        async def client():
+            return provider.client
+
+        assert asyncio.run(client()) is not asyncio.run(client())
+
+    def test_close_only_closes_current_loop(self, module, provider_class):
+        provider = getattr(module, provider_class)()
+
+        async def main():
+            client = provider.client
+            # Closing from another loop must leave this loop's client alone
+            await asyncio.to_thread(asyncio.run, module.close_shared_clients())
+            assert provider.client is client
+            await module.close_shared_clients()
+            assert provider.client is not client
+
+        asyncio.run(main())
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestTranslateBatchPacking:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        provider = openai_provider.OpenAIProvider()
+        provider.prompts = []
+        provider.replies = []
+
+        async def create_completion(system_prompt, prompt, max_tokens):
+            provider.prompts.append(prompt)
+            return completion(provider.replies.pop(0))
+
+        async def translate(text, source_lang, target_lang, timeout=None):
+            return f"single {text}"
+
+        monkeypatch.setattr(provider, "_create_completion", create_completion)
+        monkeypatch.setattr(provider, "translate", translate)
+        return provider
+
+    def test_packed_reply_is_split_in_order(self, provider):
+        provider.replies = ["1. một\n%%\n2. hai"]
+        result = asyncio.run(provider.translate_batch(["one", "two", "three"], "en", "vi", pack_size=2))
+        # A pack of one is sent as a plain translation
+        assert result == ["một", "hai", "single three"]
+        assert len(provider.prompts) == 1
+        assert "1. one\n%%\n2. two" in provider.prompts[0]
+
+    @pytest.mark.parametrize("reply", [
+        "1. một\n%%\n2. hai",              # Too few items
+        "2. hai\n%%\n1. một\n%%\n3. ba",  # Reordered
+        "1. một\n%%\nhai\n%%\n3. ba",     # Missing number
+        "1. một\n%%\n2. hai\n%%\n2. ba",  # Repeated number
+    ])
+    def test_misnumbered_reply_falls_back(self, provider, reply):
+        provider.replies = [reply]
+        result = asyncio.run(provider.translate_batch(["one", "two", "three"], "en", "vi", pack_size=3))
+        assert result == ["single one", "single two", "single three"]
+
+    def test_packs_are_capped_by_estimated_tokens(self, provider):
+        budget_chars = openai_provider.PACKED_INPUT_TOKENS * 4
+        texts = ["a" * (budget_chars // 2), "b" * (budget_chars // 2), "c", "d" * (budget_chars * 2)]
+
+        packs = openai_provider._pack_texts(texts, pack_size=10)
+        assert packs == [[texts[0]], [texts[1], texts[2]], [texts[3]]]
+
+    def test_packs_are_capped_by_item_count(self):
+        packs = openai_provider._pack_texts(["x"] * 5, pack_size=2)
+        assert [len(pack) for pack in packs] == [2, 2, 1]
+
+
+class TestModelDrops:
+    @pytest.fixture(autouse=True)
+    def fresh_drops(self, monkeypatch):
+        monkeypatch.setattr(anthropic_provider, "_dropped_models", {})
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(anthropic_provider.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_drops_are_scoped_per_key(self, clock):
+        model = anthropic_provider.MODELS[0]
+        anthropic_provider._drop_model("key-a", model)
+        assert model not in anthropic_provider._available_models("key-a")
+        assert anthropic_provider._available_models("key-b") == anthropic_provider.MODELS
+
+    def test_drops_expire(self, clock):
+        model = anthropic_provider.MODELS[0]
+        anthropic_provider._drop_model("key", model)
+        clock[0] += anthropic_provider.MODEL_DROP_TTL
+        assert anthropic_provider._available_models("key") == anthropic_provider.MODELS
+
+    def test_last_model_is_never_dropped(self, clock):
+        for model in anthropic_provider.MODELS:
+            anthropic_provider._drop_model("key", model)
+        assert anthropic_provider._available_models("key") == anthropic_provider.MODELS[-1:]
+
+    def test_translate_skips_models_not_found(self, monkeypatch):
+        provider = anthropic_provider.AnthropicProvider()
+        missing = anthropic_provider.MODELS[0]
+        calls = []
+
+        async def create_message(model, prompt):
+            calls.append(model)
+            if model == missing:
+                raise Exception("Error code: 404 - not_found_error")
+            return SimpleNamespace(content=[SimpleNamespace(text=" xin chào ")])
+
+        monkeypatch.setattr(provider, "_create_message", create_message)
+        assert asyncio.run(provider.translate("hello", "en", "vi")) == "xin chào"
+        assert asyncio.run(provider.translate("hello", "en", "vi")) == "xin chào"
+        assert calls == [missing, anthropic_provider.MODELS[1], anthropic_provider.MODELS[1]]
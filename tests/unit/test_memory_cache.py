@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.entities.translation import TranslationResult
+from src.infrastructure.repositories import memory_cache
+from src.infrastructure.repositories.memory_cache import MemoryCache
+
+
+def make_result(text="xin chào"):
+    return TranslationResult(
+        translated_text=text,
+        source_language="en",
+        target_language="vi",
+        confidence=0.9,
+        processing_time=0.1,
+    )
+
+
+@pytest.fixture
+def cache():
+    cache = MemoryCache()
+    for key in ("vi:abc", "user1:vi:abc", "user1:en:abc", "user2:vi:def"):
+        asyncio.run(cache.set(key, make_result(key)))
+    return cache
+
+
+def keys(cache):
+    return set(cache._cache)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(memory_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+class TestInvalidate:
+    def test_pattern_matches_anywhere_in_key(self, cache):
+        asyncio.run(cache.invalidate("vi:"))
+        assert keys(cache) == {"user1:en:abc"}
+
+    def test_pattern_that_is_also_a_prefix(self, cache):
+        asyncio.run(cache.invalidate("user1:"))
+        assert keys(cache) == {"vi:abc", "user2:vi:def"}
+
+    def test_unstructured_pattern(self, cache):
+        asyncio.run(cache.invalidate("abc"))
+        assert keys(cache) == {"user2:vi:def"}
+
+    def test_prefix_only_matches_start_of_key(self, cache):
+        asyncio.run(cache.invalidate_prefix("vi:"))
+        assert keys(cache) == {"user1:vi:abc", "user1:en:abc", "user2:vi:def"}
+
+    def test_prefix_not_on_separator(self, cache):
+        asyncio.run(cache.invalidate_prefix("user"))
+        assert keys(cache) == {"vi:abc"}
+
+    def test_index_follows_removals(self, cache):
+        asyncio.run(cache.invalidate("user1:vi:abc"))
+        asyncio.run(cache.invalidate_prefix("user1:"))
+        assert keys(cache) == {"vi:abc", "user2:vi:def"}
+        assert "user1:" not in cache._prefix_index
+        assert cache._prefix_index["user2:"] == {"user2:vi:def"}
+
+
+class TestGet:
+    def test_returns_a_copy(self):
+        cache = MemoryCache()
+        result = make_result()
+        result.metadata["source"] = "llm"
+        asyncio.run(cache.set("key", result))
+
+        result.translated_text = "changed after set"
+        result.metadata["source"] = "changed after set"
+        first = asyncio.run(cache.get("key"))
+        first.translated_text = "changed after get"
+        first.metadata["extra"] = True
+
+        second = asyncio.run(cache.get("key"))
+        assert second.translated_text == "xin chào"
+        assert second.metadata == {"source": "llm"}
+
+    def test_expired_entry_is_removed(self, clock):
+        cache = MemoryCache(default_ttl=10)
+        asyncio.run(cache.set("key", make_result()))
+        clock[0] += 11
+        assert asyncio.run(cache.get("key")) is None
+        assert keys(cache) == set()
+
+
+class TestEviction:
+    @pytest.fixture
+    def full_cache(self, clock):
+        cache = MemoryCache(default_ttl=100)
+        cache._max_size = 3
+        asyncio.run(cache.set("old", make_result()))
+        asyncio.run(cache.set("short", make_result(), ttl=5))
+        asyncio.run(cache.set("new", make_result()))
+        return cache
+
+    def test_least_recently_used_is_evicted(self, full_cache):
+        asyncio.run(full_cache.get("old"))
+        asyncio.run(full_cache.set("extra", make_result()))
+        assert keys(full_cache) == {"old", "new", "extra"}
+
+    def test_expired_entries_are_evicted_first(self, full_cache, clock):
+        clock[0] += 6
+        asyncio.run(full_cache.set("extra", make_result()))
+        assert keys(full_cache) == {"old", "new", "extra"}
+
+    def test_all_expired_entries_are_evicted(self, full_cache, clock):
+        clock[0] += 101
+        asyncio.run(full_cache.set("extra", make_result()))
+        assert keys(full_cache) == {"extra"}
+        assert full_cache._total_size == full_cache._cache["extra"].size
+        assert set(full_cache._prefix_index) == set()
+
+
+class TestStats:
+    def test_memory_usage_counts_nested_metadata(self):
+        cache = MemoryCache()
+        result = make_result("")
+        result.metadata["segments"] = ["x" * 500_000]
+        asyncio.run(cache.set("key", result))
+        assert cache.get_stats()["memory_usage_mb"] > 0.95
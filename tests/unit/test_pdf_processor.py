@@ -0,0 +1,59 @@
+import io
+import logging
+
+import pytest
+
+from src.infrastructure.processors import pdf_processor
+from src.infrastructure.processors.pdf_processor import PDFProcessor
+
+COMPLETE_PDF = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\n"
+TRUNCATED_PDF = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n"
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    processor = PDFProcessor()
+    # Only the checks in process() are under test, not text extraction
+    monkeypatch.setattr(processor, "_extract_text_auto", lambda pdf_bytes: {
+        "text": "text", "method": "stub", "page_count": 1
+    })
+    return processor
+
+
+def eof_warnings(caplog):
+    return [r for r in caplog.records if "%%EOF" in r.getMessage()]
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+class TestTrailerCheck:
+    def test_complete_pdf_has_no_warning(self, processor, caplog, wrap):
+        with caplog.at_level(logging.WARNING, logger=pdf_processor.logger.name):
+            result = processor.process(wrap(COMPLETE_PDF), "doc.pdf")
+        assert result.success
+        assert not eof_warnings(caplog)
+
+    def test_truncated_pdf_is_reported(self, processor, caplog, wrap):
+        with caplog.at_level(logging.WARNING, logger=pdf_processor.logger.name):
+            result = processor.process(wrap(TRUNCATED_PDF), "doc.pdf")
+        assert result.success
+        assert eof_warnings(caplog)
+
+
+class TestFileInput:
+    def test_stream_is_read_from_its_position(self, processor, tmp_path):
+        path = tmp_path / "bundle.bin"
+        path.write_bytes(b"header" + COMPLETE_PDF)
+        with open(path, "rb") as stream:
+            stream.seek(len(b"header"))
+            result = processor.process(stream, "doc.pdf")
+        assert result.success
+        assert result.file_size == len(COMPLETE_PDF)
+
+    def test_file_from_start_is_mapped(self, processor, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(COMPLETE_PDF)
+        with open(path, "rb") as stream:
+            assert processor._map_file(stream) is not None
+            result = processor.process(stream, "doc.pdf")
+        assert result.success
+        assert result.file_size == len(COMPLETE_PDF)
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.llm.providers._common import ProviderPool, prompt_prefix
+
+
+class FakeClient:
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    return ProviderPool(FakeClient, "TESTPROVIDER", max_concurrent_requests=4, requests_per_minute=120)
+
+
+class TestProviderPool:
+    def test_defaults_and_env_overrides(self, pool, monkeypatch):
+        assert (pool.max_concurrent_requests, pool.requests_per_minute) == (4, 120.0)
+
+        monkeypatch.setenv("TESTPROVIDER_MAX_CONCURRENT_REQUESTS", "2")
+        monkeypatch.setenv("TESTPROVIDER_REQUESTS_PER_MINUTE", "30")
+        overridden = ProviderPool(FakeClient, "TESTPROVIDER", 4, 120)
+        assert (overridden.max_concurrent_requests, overridden.requests_per_minute) == (2, 30.0)
+        assert overridden.rate_limiter.capacity == 30.0
+
+    def test_one_client_per_loop_and_key(self, pool):
+        async def clients():
+            return pool.client("a"), pool.client("a"), pool.client("b")
+
+        first, same, other = asyncio.run(clients())
+        assert first is same
+        assert other is not first and other.api_key == "b"
+        assert asyncio.run(clients())[0] is not first
+
+    def test_close_clients_of_current_loop(self, pool):
+        async def main():
+            client = pool.client("a")
+            await pool.close_clients()
+            return client, pool.client("a")
+
+        closed, fresh = asyncio.run(main())
+        assert closed.closed
+        assert fresh is not closed
+
+    def test_request_slot_per_loop(self, pool):
+        async def slots():
+            return pool.request_slot(), pool.request_slot()
+
+        first, same = asyncio.run(slots())
+        assert first is same
+        assert asyncio.run(slots())[0] is not first
+
+
+def test_prompt_prefix():
+    prefix = prompt_prefix("en", "vi")
+    assert prefix.startswith("Translate the following text from English to Vietnamese.")
+    assert prefix.endswith("Text: ")
+    assert prompt_prefix("xx", "vi").startswith("Translate the following text from xx to")
@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.utils import rate_limiter
+from src.core.utils.rate_limiter import AsyncTokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeping in the limiter advances it instead of waiting."""
+    now = [1000.0]
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=sleep))
+    return SimpleNamespace(now=now, sleeps=sleeps)
+
+
+def acquire_many(bucket, count, amount=1.0):
+    async def main():
+        for _ in range(count):
+            await bucket.acquire(amount)
+
+    asyncio.run(main())
+
+
+class TestAsyncTokenBucket:
+    def test_burst_up_to_capacity_does_not_wait(self, clock):
+        bucket = AsyncTokenBucket(60, per=60.0)
+        acquire_many(bucket, 60)
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_when_empty(self, clock):
+        bucket = AsyncTokenBucket(60, per=60.0)
+        acquire_many(bucket, 62)
+        # One token per second once the burst is spent
+        assert clock.sleeps == pytest.approx([1.0, 1.0])
+
+    def test_tokens_refill_over_time(self, clock):
+        bucket = AsyncTokenBucket(10, per=10.0)
+        acquire_many(bucket, 10)
+        clock.now[0] += 5
+        acquire_many(bucket, 5)
+        assert clock.sleeps == []
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        bucket = AsyncTokenBucket(10, per=10.0, capacity=2)
+        clock.now[0] += 100
+        acquire_many(bucket, 3)
+        assert clock.sleeps == pytest.approx([1.0])
+
+    def test_amount_larger_than_capacity_is_clamped(self, clock):
+        bucket = AsyncTokenBucket(10, per=10.0, capacity=2)
+        acquire_many(bucket, 1, amount=5)
+        assert clock.sleeps == []
+
+    def test_slow_down_reduces_rate_for_a_while(self, clock):
+        bucket = AsyncTokenBucket(60, per=60.0, capacity=1)
+        acquire_many(bucket, 1)
+        bucket.slow_down(factor=0.5, duration=30.0)
+        acquire_many(bucket, 1)
+        assert clock.sleeps == pytest.approx([2.0])
+
+        clock.now[0] += 30
+        acquire_many(bucket, 2)
+        assert clock.sleeps[1:] == pytest.approx([1.0])
+
+    def test_context_manager_takes_a_token(self, clock):
+        bucket = AsyncTokenBucket(1, per=1.0)
+
+        async def main():
+            async with bucket:
+                pass
+            async with bucket:
+                pass
+
+        asyncio.run(main())
+        assert clock.sleeps == pytest.approx([1.0])
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.models.document import DocumentChunk
+from src.infrastructure.document_processing.cache import result_store
+from src.infrastructure.document_processing.cache.result_store import ResultStore
+from src.infrastructure.document_processing.orchestrators.model_orchestrator import ModelOrchestrator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(result_store, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "nested" / "results.db")
+
+
+@pytest.fixture
+def store(store_path):
+    store = ResultStore(store_path, ttl_seconds=60)
+    yield store
+    store.close()
+
+
+class TestResultStore:
+    def test_get_missing_key(self, store):
+        assert store.get("missing") is None
+
+    def test_set_replaces_previous_value(self, store):
+        store.set("key", "first")
+        store.set("key", "second")
+        assert store.get("key") == "second"
+
+    def test_values_survive_reopening(self, store_path):
+        store = ResultStore(store_path)
+        store.set("key", "xin chào")
+        store.close()
+
+        reopened = ResultStore(store_path)
+        assert reopened.get("key") == "xin chào"
+        reopened.close()
+
+    def test_entries_expire(self, store, clock):
+        store.set("key", "value")
+        clock[0] += 59
+        assert store.get("key") == "value"
+        clock[0] += 2
+        assert store.get("key") is None
+
+    def test_expired_entries_are_purged_on_open(self, store_path, clock):
+        store = ResultStore(store_path, ttl_seconds=60)
+        store.set("key", "value")
+        store.close()
+        clock[0] += 61
+
+        reopened = ResultStore(store_path, ttl_seconds=60)
+        count = reopened._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        reopened.close()
+        assert count == 0
+
+    def test_purge_expired(self, store, clock):
+        store.set("old", "value")
+        clock[0] += 30
+        store.set("new", "value")
+        clock[0] += 31
+        assert store.purge_expired() == 1
+        assert store.get("new") == "value"
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def translate(self, prompt, **kwargs):
+        self.calls += 1
+        return "processed"
+
+
+class TestOrchestratorResultStore:
+    def test_responses_are_reused_across_instances(self, store_path):
+        chunk = DocumentChunk(content="some text", start_position=0, end_position=9)
+
+        def process():
+            orchestrator = ModelOrchestrator(result_store_path=store_path)
+            llm = CountingLLM()
+            result = asyncio.run(orchestrator._process_single_chunk(chunk, "gpt-3.5-turbo", {}, llm=llm))
+            orchestrator._result_store.close()
+            return result, llm.calls
+
+        first, first_calls = process()
+        second, second_calls = process()
+        assert (first.processed_content, first_calls) == ("processed", 1)
+        assert (second.processed_content, second_calls) == ("processed", 0)
+        assert second.metadata["cached"] is True
+
+    def test_store_io_runs_off_the_event_loop(self, store_path):
+        orchestrator = ModelOrchestrator(result_store_path=store_path)
+        store = orchestrator._result_store
+        threads = []
+
+        class RecordingStore:
+            def get(self, key):
+                threads.append(threading.current_thread())
+                return store.get(key)
+
+            def set(self, key, value):
+                threads.append(threading.current_thread())
+                store.set(key, value)
+
+        orchestrator._result_store = RecordingStore()
+        chunk = DocumentChunk(content="some text", start_position=0, end_position=9)
+        asyncio.run(orchestrator._process_single_chunk(chunk, "gpt-3.5-turbo", {}, llm=CountingLLM()))
+        store.close()
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    def test_fallback_output_is_not_cached(self, store_path, monkeypatch):
+        orchestrator = ModelOrchestrator(result_store_path=store_path)
+        monkeypatch.setattr(orchestrator, "_get_provider_client", lambda provider: None)
+        chunk = DocumentChunk(content="some text", start_position=0, end_position=9)
+
+        result = asyncio.run(orchestrator._process_single_chunk(chunk, "gpt-3.5-turbo", {}))
+        assert not result.error
+        assert orchestrator._result_cache == {}
+        assert orchestrator._result_store._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
+        orchestrator._result_store.close()
@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services import translation_service
+from src.application.services.translation_service import TranslationService
+from src.core.exceptions import TranslationError
+
+
+class FakeLLM:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def translate(self, text, source_lang, target_lang):
+        self.calls.append(text)
+        # Yield so that concurrent duplicates find this request in flight
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"{target_lang}:{text}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        translation_service, "time", SimpleNamespace(time=lambda: now[0], monotonic=lambda: now[0])
+    )
+    return now
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def make(enable_cache=True, fail=False):
+        service = TranslationService(enable_cache=enable_cache)
+        service._llm = FakeLLM(fail=fail)
+        return service
+
+    return make
+
+
+def translate_all(service, texts):
+    async def main():
+        return await asyncio.gather(*(service.translate_text(t, "en", "vi") for t in texts))
+
+    return [result.translated_text for result in asyncio.run(main())]
+
+
+class TestSingleFlight:
+    def test_concurrent_duplicates_share_one_request(self, make_service):
+        service = make_service()
+        assert translate_all(service, ["hello"] * 5 + ["bye"]) == ["vi:hello"] * 5 + ["vi:bye"]
+        assert service._llm.calls == ["hello", "bye"]
+        assert service._inflight == {}
+
+    def test_failure_reaches_every_waiter_and_is_not_cached(self, make_service):
+        service = make_service(fail=True)
+
+        async def main():
+            return await asyncio.gather(
+                *(service.translate_text("hello", "en", "vi") for _ in range(3)),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, TranslationError) for result in results)
+        assert service._llm.calls == ["hello"]
+        assert service._inflight == {}
+
+        service._llm.fail = False
+        assert translate_all(service, ["hello"]) == ["vi:hello"]
+        assert service._llm.calls == ["hello", "hello"]
+
+    def test_cancelled_leader_does_not_cancel_followers(self, make_service):
+        service = make_service()
+
+        async def main():
+            release = asyncio.Event()
+            translate = service._llm.translate
+
+            async def slow_translate(text, source_lang, target_lang):
+                await release.wait()
+                return await translate(text, source_lang, target_lang)
+
+            service._llm.translate = slow_translate
+            leader = asyncio.create_task(service.translate_text("hello", "en", "vi"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(service.translate_text("hello", "en", "vi"))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        result = asyncio.run(main())
+        assert result.translated_text == "vi:hello"
+        # Only the follower's retry reached the provider
+        assert service._llm.calls == ["hello"]
+        assert service._inflight == {}
+
+    def test_no_coalescing_without_cache(self, make_service):
+        service = make_service(enable_cache=False)
+        translate_all(service, ["hello"] * 3)
+        assert service._llm.calls == ["hello"] * 3
+
+
+class TestCache:
+    def test_repeated_text_is_served_from_cache(self, make_service):
+        service = make_service()
+        translate_all(service, ["hello"])
+        translate_all(service, ["hello"])
+        assert service._llm.calls == ["hello"]
+        assert service.get_cache_stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_least_recently_used_entry_is_evicted(self, make_service, monkeypatch):
+        monkeypatch.setattr(translation_service, "CACHE_MAX_ENTRIES", 2)
+        service = make_service()
+        for text in ("a", "b", "a", "c", "a", "b"):
+            translate_all(service, [text])
+        # "b" was least recently used when "c" arrived
+        assert service._llm.calls == ["a", "b", "c", "b"]
+        assert len(service._cache) == 2
+
+    def test_entries_expire(self, make_service, clock):
+        service = make_service()
+        translate_all(service, ["hello"])
+        clock[0] += translation_service.CACHE_TTL_SECONDS + 1
+        translate_all(service, ["hello"])
+        assert service._llm.calls == ["hello", "hello"]
+
+    def test_key_depends_on_languages(self, make_service):
+        service = make_service()
+
+        async def main():
+            await service.translate_text("hello", "en", "vi")
+            await service.translate_text("hello", "en", "fr")
+
+        asyncio.run(main())
+        assert service._llm.calls == ["hello", "hello"]
+
+
+class TestTranslateBatch:
+    def test_preserves_order_and_deduplicates(self, make_service):
+        service = make_service()
+        results = asyncio.run(service.translate_batch(["a", "b", "a", "c", "b"], "en", "vi", concurrency=2))
+        assert [result.translated_text for result in results] == ["vi:a", "vi:b", "vi:a", "vi:c", "vi:b"]
+        assert sorted(service._llm.calls) == ["a", "b", "c"]